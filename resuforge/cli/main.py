@@ -7,13 +7,30 @@ goes through rich.console — never use print().
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
 from resuforge import __version__
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Return the shared rich console, importing rich on first use.
+
+    rich costs ~150ms to import; cold commands like --help and
+    --version never need it.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 @click.group()
@@ -31,6 +48,7 @@ def app() -> None:
 @click.option("--diff", is_flag=True, help="Show diff of changes made")
 @click.option("--dry-run", is_flag=True, help="Show changes without writing files")
 @click.option("--model", type=str, help="LLM model to use")
+@click.option("--no-cache", is_flag=True, help="Bypass the LLM completion cache")
 @click.option("--verbose", is_flag=True, help="Verbose logging")
 def tailor(
     resume: str,
@@ -41,6 +59,7 @@ def tailor(
     diff: bool,
     dry_run: bool,
     model: str | None,
+    no_cache: bool,
     verbose: bool,
 ) -> None:
     """Tailor a resume to match a job description."""
@@ -54,6 +73,7 @@ def tailor(
         diff=diff,
         dry_run=dry_run,
         model=model,
+        no_cache=no_cache,
         verbose=verbose,
     )
 
@@ -69,6 +89,7 @@ def _run_tailor_pipeline(
     dry_run: bool,
     model: str | None,
     verbose: bool,
+    no_cache: bool = False,
     llm_override: object | None = None,
 ) -> None:
     """Execute the full tailoring pipeline.
@@ -85,10 +106,12 @@ def _run_tailor_pipeline(
         dry_run: Whether to skip writing files.
         model: LLM model override.
         verbose: Whether to show verbose output.
+        no_cache: Whether to bypass the LLM completion cache.
         llm_override: Optional LLM provider override (for testing).
     """
+    import asyncio
+
     from resuforge.config.settings import load_config
-    from resuforge.cover_letter.generator import generate_cover_letter
     from resuforge.ingestion.jd_parser import parse_jd
     from resuforge.llm.base import LLMProvider
     from resuforge.resume.latex_parser import parse_latex
@@ -97,19 +120,22 @@ def _run_tailor_pipeline(
     from resuforge.utils.diff import display_changes
     from resuforge.utils.file_utils import write_file
 
+    # Parse the input path once; every downstream consumer reuses it.
+    resume_p = Path(resume_path)
+
     # Step 1: Parse resume
-    with console.status("[bold cyan]Parsing resume..."):
-        resume_ir = parse_latex(Path(resume_path))
+    with _get_console().status("[bold cyan]Parsing resume..."):
+        resume_ir = parse_latex(resume_p)
 
     if verbose:
-        console.print(f"[dim]Parsed {len(resume_ir.experience)} experience entries[/dim]")
+        _get_console().print(f"[dim]Parsed {len(resume_ir.experience)} experience entries[/dim]")
 
     # Step 2: Parse JD
-    with console.status("[bold cyan]Parsing job description..."):
+    with _get_console().status("[bold cyan]Parsing job description..."):
         jd_obj = parse_jd(Path(jd_path))
 
     if verbose:
-        console.print(f"[dim]JD: {jd_obj.job_title} at {jd_obj.company}[/dim]")
+        _get_console().print(f"[dim]JD: {jd_obj.job_title} at {jd_obj.company}[/dim]")
 
     # Step 3: Initialize LLM
     if llm_override and isinstance(llm_override, LLMProvider):
@@ -121,16 +147,34 @@ def _run_tailor_pipeline(
         config = load_config()
         llm_model = model or config.default_model
         try:
-            llm = AnthropicClient(model=llm_model)
+            llm = AnthropicClient(model=llm_model, max_concurrency=config.max_concurrency)
         except LLMError as exc:
-            console.print(f"[bold red]Error:[/bold red] {exc}")
+            _get_console().print(f"[bold red]Error:[/bold red] {exc}")
             raise SystemExit(1) from exc
 
-    # Step 4: Tailor resume
-    with console.status("[bold cyan]Tailoring resume..."):
-        result = tailor_resume(resume_ir, jd_obj, llm=llm)
+    # Step 4: Tailor resume (concurrently with the cover letter when both
+    # are needed — the letter is grounded in the parsed IR, so neither
+    # call depends on the other's output)
+    cl_text: str | None = None
+    if cover_letter and not dry_run:
+        from resuforge.cover_letter.generator import agenerate_cover_letter
+        from resuforge.tailoring.engine import atailor_resume
+
+        async def _tailor_and_letter() -> tuple[object, str]:
+            return await asyncio.gather(  # type: ignore[return-value]
+                atailor_resume(resume_ir, jd_obj, llm=llm, use_cache=not no_cache),
+                agenerate_cover_letter(
+                    resume_ir, jd_obj, llm=llm, use_cache=not no_cache
+                ),
+            )
+
+        with _get_console().status("[bold cyan]Tailoring resume and writing cover letter..."):
+            result, cl_text = asyncio.run(_tailor_and_letter())  # type: ignore[assignment]
+    else:
+        with _get_console().status("[bold cyan]Tailoring resume..."):
+            result = tailor_resume(resume_ir, jd_obj, llm=llm, use_cache=not no_cache)
 
-    console.print(f"[bold green]Done![/bold green] {len(result.changes)} change(s) made.")
+    _get_console().print(f"[bold green]Done![/bold green] {len(result.changes)} change(s) made.")
 
     # Step 5: Show diff if requested
     if diff or dry_run:
@@ -138,27 +182,35 @@ def _run_tailor_pipeline(
 
     # Step 6: If dry-run, stop here
     if dry_run:
-        console.print("[dim]Dry run — no files written.[/dim]")
+        _get_console().print("[dim]Dry run — no files written.[/dim]")
         return
 
-    # Step 7: Render and write output
+    # Step 7: Render output. The cover letter, when requested, was
+    # already produced concurrently in step 4 — dry runs return above.
     rendered = render_latex(result.resume)
-    out_path = _resolve_output_path(resume_path, output_path, output_dir, "_tailored.tex")
-    write_file(out_path, rendered)
-    console.print(f"[bold]Tailored resume written to:[/bold] {out_path}")
-
-    # Step 8: Generate cover letter if requested
-    if cover_letter:
-        with console.status("[bold cyan]Generating cover letter..."):
-            cl_text = generate_cover_letter(result.resume, jd_obj, llm=llm)
-
-        cl_path = _resolve_output_path(resume_path, None, output_dir, "_cover_letter.tex")
-        write_file(cl_path, cl_text)
-        console.print(f"[bold]Cover letter written to:[/bold] {cl_path}")
+    out_path = _resolve_output_path(resume_p, output_path, output_dir, "_tailored.tex")
+
+    # Step 8: Write output files — both flushed concurrently when a
+    # cover letter was generated
+    if cover_letter and cl_text is not None:
+        cl_path = _resolve_output_path(resume_p, None, output_dir, "_cover_letter.tex")
+
+        async def _write_outputs() -> None:
+            await asyncio.gather(
+                asyncio.to_thread(write_file, out_path, rendered),
+                asyncio.to_thread(write_file, cl_path, cl_text),
+            )
+
+        asyncio.run(_write_outputs())
+        _get_console().print(f"[bold]Tailored resume written to:[/bold] {out_path}")
+        _get_console().print(f"[bold]Cover letter written to:[/bold] {cl_path}")
+    else:
+        write_file(out_path, rendered)
+        _get_console().print(f"[bold]Tailored resume written to:[/bold] {out_path}")
 
 
 def _resolve_output_path(
-    input_path: str,
+    input_path: Path,
     explicit_output: str | None,
     output_dir: str | None,
     suffix: str,
@@ -166,7 +218,8 @@ def _resolve_output_path(
     """Determine the output file path.
 
     Args:
-        input_path: Original input file path.
+        input_path: Original input file path (already parsed — callers
+            construct it once and reuse it per output).
         explicit_output: Explicitly specified output path.
         output_dir: Output directory.
         suffix: Suffix to append (e.g., '_tailored.tex').
@@ -177,14 +230,12 @@ def _resolve_output_path(
     if explicit_output:
         return Path(explicit_output)
 
-    input_p = Path(input_path)
-    stem = input_p.stem
-    filename = f"{stem}{suffix}"
+    filename = f"{input_path.stem}{suffix}"
 
     if output_dir:
         return Path(output_dir) / filename
 
-    return input_p.parent / filename
+    return input_path.parent / filename
 
 
 @app.command()
@@ -197,20 +248,20 @@ def config(set_key: str | None, set_model: str | None) -> None:
     cfg = load_config()
 
     if set_key:
-        console.print(
+        _get_console().print(
             "[bold yellow]Note:[/bold yellow] API keys should be set via environment "
             "variables (ANTHROPIC_API_KEY) for security. Not saving to config file."
         )
     elif set_model:
         cfg.default_model = set_model
         save_config(cfg)
-        console.print(f"[bold green]Default model set to:[/bold green] {set_model}")
+        _get_console().print(f"[bold green]Default model set to:[/bold green] {set_model}")
     else:
-        console.print("[bold]Current configuration:[/bold]")
-        console.print(f"  Provider: {cfg.provider}")
-        console.print(f"  Model: {cfg.default_model}")
-        console.print(f"  Output format: {cfg.output_format}")
-        console.print(f"  Cover letter tone: {cfg.cover_letter_tone}")
+        _get_console().print("[bold]Current configuration:[/bold]")
+        _get_console().print(f"  Provider: {cfg.provider}")
+        _get_console().print(f"  Model: {cfg.default_model}")
+        _get_console().print(f"  Output format: {cfg.output_format}")
+        _get_console().print(f"  Cover letter tone: {cfg.cover_letter_tone}")
 
 
 @app.command()
@@ -219,7 +270,7 @@ def config(set_key: str | None, set_model: str | None) -> None:
 @click.option("--use", type=str, help="Set default profile")
 def profile(add: str | None, list_profiles: bool, use: str | None) -> None:
     """Manage resume profiles."""
-    console.print("[bold red]Not yet implemented.[/bold red] Profile management coming in v0.2.")
+    _get_console().print("[bold red]Not yet implemented.[/bold red] Profile management coming in v0.2.")
 
 
 if __name__ == "__main__":
@@ -8,12 +8,22 @@ Priority: env vars > config file > defaults.
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field
 
+# Prefer libyaml's C loader/dumper — 10-50x faster than the pure-Python
+# classes, and config parsing is on the CLI cold-start path.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 CONFIG_DIR = Path.home() / ".resuforge"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
@@ -29,15 +39,21 @@ class ResuForgeConfig(BaseModel):
     default_resume: str | None = None
     output_format: str = "tex"
     cover_letter_tone: str = "professional"
+    max_concurrency: int = 4
     anthropic_api_key: str | None = Field(default=None, exclude=True)
     openai_api_key: str | None = Field(default=None, exclude=True)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> ResuForgeConfig:
     """Load configuration from file and environment variables.
 
     Priority: env vars > config file > defaults.
 
+    The result is memoized for the life of the process — config and env
+    don't change mid-run, and several pipeline stages call this.
+    save_config clears the cache so fresh saves are visible.
+
     Returns:
         A validated ResuForgeConfig instance.
     """
@@ -47,7 +63,7 @@ def load_config() -> ResuForgeConfig:
     # Layer 2: Override with config file if exists
     if CONFIG_FILE.exists():
         raw = CONFIG_FILE.read_text(encoding="utf-8")
-        file_data = yaml.safe_load(raw)
+        file_data = yaml.load(raw, Loader=_YamlLoader)  # noqa: S506 — safe loader
         if isinstance(file_data, dict):
             data.update(file_data)
 
@@ -88,6 +104,9 @@ def save_config(config: ResuForgeConfig) -> None:
     clean_data = {k: v for k, v in data.items() if v is not None}
 
     CONFIG_FILE.write_text(
-        yaml.dump(clean_data, default_flow_style=False),
+        yaml.dump(clean_data, Dumper=_YamlDumper, default_flow_style=False),
         encoding="utf-8",
     )
+
+    # Make the saved values visible to subsequent load_config() calls.
+    load_config.cache_clear()
@@ -7,11 +7,28 @@ named claim appears in the IR.
 
 from __future__ import annotations
 
+import hashlib
+from pathlib import Path
+
 from pydantic import BaseModel
 
-from resuforge.cover_letter.prompts import PROMPT_COVER_LETTER, SYSTEM_COVER_LETTER
-from resuforge.cover_letter.verification import GroundingViolationError, verify_grounding
-from resuforge.llm.base import LLMProvider
+from resuforge.cover_letter.prompts import (
+    SYSTEM_COVER_LETTER,
+    format_cover_letter_resume,
+    format_cover_letter_task,
+)
+from resuforge.cover_letter.verification import (
+    GroundingScanner,
+    GroundingViolationError,
+    verify_grounding,
+)
+from resuforge.llm.base import LLMProvider, UserContent
+from resuforge.llm.cache import (
+    CACHE_DIR,
+    cache_lookup,
+    cache_store,
+    cached_complete,
+)
 from resuforge.resume.ir_schema import JDObject, ResumeIR
 
 
@@ -26,6 +43,7 @@ def generate_cover_letter(
     jd: JDObject,
     *,
     llm: LLMProvider,
+    use_cache: bool = True,
 ) -> str:
     """Generate a grounded cover letter in LaTeX format.
 
@@ -33,6 +51,7 @@ def generate_cover_letter(
         resume: The resume IR (source of truth for all claims).
         jd: The parsed job description.
         llm: LLM provider for generation.
+        use_cache: Whether to consult the completion disk cache.
 
     Returns:
         A compilable LaTeX string for the cover letter.
@@ -41,30 +60,235 @@ def generate_cover_letter(
         GroundingViolationError: If the generated letter references facts
             not present in the resume IR.
     """
-    resume_json = resume.model_dump_json(indent=2)
-    jd_json = jd.model_dump_json(indent=2)
+    user_prompt = _build_user_prompt(resume, jd)
 
-    company = jd.company or "the company"
-    job_title = jd.job_title or "the position"
+    if use_cache:
+        response = cached_complete(
+            llm,
+            system=SYSTEM_COVER_LETTER,
+            user=user_prompt,
+            response_model=CoverLetterResponse,
+        )
+    else:
+        response = llm.complete(
+            system=SYSTEM_COVER_LETTER,
+            user=user_prompt,
+            response_model=CoverLetterResponse,
+        )
 
-    user_prompt = PROMPT_COVER_LETTER.format(
-        resume_json=resume_json,
-        jd_json=jd_json,
-        company=company,
-        job_title=job_title,
-    )
+    letter_text = response.content
+    _ensure_grounded(letter_text, resume, jd, skip_if_marked=use_cache)
+    return letter_text
 
-    response = llm.complete(
-        system=SYSTEM_COVER_LETTER,
-        user=user_prompt,
-        response_model=CoverLetterResponse,
-    )
 
-    letter_text = response.content
+async def agenerate_cover_letter(
+    resume: ResumeIR,
+    jd: JDObject,
+    *,
+    llm: LLMProvider,
+    use_cache: bool = True,
+) -> str:
+    """Async twin of generate_cover_letter.
 
-    # Post-generation grounding check
-    violations = verify_grounding(letter_text, resume)
+    Lets the pipeline run cover letter generation concurrently with
+    tailoring — both depend only on the parsed resume and JD. With a
+    streaming-capable provider, grounding verification runs over text
+    deltas as they arrive instead of as a serial pass afterwards.
+
+    Args:
+        resume: The resume IR (source of truth for all claims).
+        jd: The parsed job description.
+        llm: LLM provider for generation.
+        use_cache: Whether to consult the completion disk cache.
+
+    Returns:
+        A compilable LaTeX string for the cover letter.
+
+    Raises:
+        GroundingViolationError: If the generated letter references facts
+            not present in the resume IR.
+    """
+    user_prompt = _build_user_prompt(resume, jd)
+
+    if use_cache:
+        hit = cache_lookup(
+            llm,
+            system=SYSTEM_COVER_LETTER,
+            user=user_prompt,
+            response_model=CoverLetterResponse,
+        )
+        if hit is not None:
+            _ensure_grounded(hit.content, resume, jd, skip_if_marked=True)
+            return hit.content
+
+    if llm.supports_streaming:
+        # The response schema is a single text field, so the raw token
+        # stream IS the structured payload — wrap it in the validated
+        # model once complete. Verification overlaps generation.
+        letter_text = await _stream_and_verify(
+            llm, user_prompt, resume, jd, mark_verified=use_cache
+        )
+        response = CoverLetterResponse(content=letter_text)
+    else:
+        response = await llm.acomplete(
+            system=SYSTEM_COVER_LETTER,
+            user=user_prompt,
+            response_model=CoverLetterResponse,
+        )
+        letter_text = response.content
+        _ensure_grounded(letter_text, resume, jd, skip_if_marked=use_cache)
+
+    if use_cache:
+        cache_store(
+            llm,
+            system=SYSTEM_COVER_LETTER,
+            user=user_prompt,
+            response_model=CoverLetterResponse,
+            result=response,
+        )
+    return letter_text
+
+
+async def _stream_and_verify(
+    llm: LLMProvider,
+    user_prompt: UserContent,
+    resume: ResumeIR,
+    jd: JDObject,
+    *,
+    mark_verified: bool,
+) -> str:
+    """Stream the letter, verifying grounding as deltas arrive.
+
+    Args:
+        llm: Streaming-capable LLM provider.
+        user_prompt: Pre-built structured user prompt.
+        resume: Source resume IR for grounding.
+        jd: Parsed job description (its terms are allowed in the letter).
+        mark_verified: Whether to record the verification verdict marker.
+
+    Returns:
+        The complete letter text.
+
+    Raises:
+        GroundingViolationError: If the letter references facts not
+            present in the resume IR.
+    """
+    scanner = GroundingScanner(resume, jd)
+    parts: list[str] = []
+
+    async for delta in llm.astream(system=SYSTEM_COVER_LETTER, user=user_prompt):
+        parts.append(delta)
+        scanner.feed(delta)
+
+    letter_text = "".join(parts)
+    violations = scanner.finish()
     if violations:
         raise GroundingViolationError(violations)
 
+    if mark_verified:
+        _write_verified_marker(letter_text, resume, jd)
     return letter_text
+
+
+def _ensure_grounded(
+    letter_text: str, resume: ResumeIR, jd: JDObject, *, skip_if_marked: bool
+) -> None:
+    """Run the grounding check, skipping it for already-verified inputs.
+
+    A (letter, resume, jd) triple that passed verification once leaves a
+    content-addressed marker beside the completion cache, so cache hits
+    for unchanged inputs skip the vocab build and letter scan entirely.
+
+    Args:
+        letter_text: Generated cover letter text.
+        resume: Source resume IR.
+        jd: Parsed job description (its terms are allowed in the letter).
+        skip_if_marked: Whether to consult/write the verdict marker
+            (disabled together with the completion cache).
+
+    Raises:
+        GroundingViolationError: If the letter references facts not
+            present in the resume IR.
+    """
+    marker = None
+    if skip_if_marked:
+        marker = _verdict_marker(letter_text, resume, jd)
+        if marker.exists():
+            return
+
+    violations = verify_grounding(letter_text, resume, jd)
+    if violations:
+        raise GroundingViolationError(violations)
+
+    if marker is not None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+
+
+def _verdict_marker(letter_text: str, resume: ResumeIR, jd: JDObject) -> Path:
+    """Resolve the content-addressed verification marker path.
+
+    Args:
+        letter_text: Generated cover letter text.
+        resume: Source resume IR.
+        jd: Parsed job description (part of the allowed vocabulary).
+
+    Returns:
+        Marker path for this (letter, resume, jd) triple.
+    """
+    # BLAKE2b — measurably faster than SHA-256 at this input size.
+    tag = hashlib.blake2b(
+        letter_text.encode("utf-8")
+        + b"\x00"
+        + resume.model_dump_json().encode("utf-8")
+        + b"\x00"
+        + jd.model_dump_json().encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return CACHE_DIR / f"verified-{tag}"
+
+
+def _write_verified_marker(letter_text: str, resume: ResumeIR, jd: JDObject) -> None:
+    """Record that a (letter, resume, jd) triple passed grounding verification.
+
+    Args:
+        letter_text: Generated cover letter text.
+        resume: Source resume IR.
+        jd: Parsed job description (part of the allowed vocabulary).
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _verdict_marker(letter_text, resume, jd).touch()
+
+
+def _build_user_prompt(resume: ResumeIR, jd: JDObject) -> list[dict[str, object]]:
+    """Build the structured user prompt for cover letter generation.
+
+    Stable resume block first (and cacheable server-side), volatile
+    JD/task block after, so prompt-cache prefixes match across calls.
+
+    Args:
+        resume: The resume IR.
+        jd: The parsed job description.
+
+    Returns:
+        Messages API content parts with cache_control on the resume block.
+    """
+    # Compact JSON — pretty-printing only adds whitespace tokens (and a
+    # larger intermediate string) without helping the model.
+    resume_json = resume.model_dump_json()
+    jd_json = jd.model_dump_json()
+
+    company = jd.company or "the company"
+    job_title = jd.job_title or "the position"
+
+    return [
+        {
+            "type": "text",
+            "text": format_cover_letter_resume(resume_json),
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": format_cover_letter_task(jd_json, company, job_title),
+        },
+    ]
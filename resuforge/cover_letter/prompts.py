@@ -16,17 +16,53 @@ Structure:
 Tone: professional but authentic. Avoid generic filler phrases.
 """
 
-PROMPT_COVER_LETTER = """Write a cover letter for this position.
+# The prompt is split into a stable resume block (marked with
+# cache_control so Anthropic reuses its server-side KV cache across
+# calls sharing the same resume) and a volatile task block.
+PROMPT_COVER_LETTER_RESUME = """<resume>
+{resume_json}
+</resume>"""
+
+PROMPT_COVER_LETTER_TASK = """Write a cover letter for this position.
 
 <job_description>
 {jd_json}
 </job_description>
 
-<resume>
-{resume_json}
-</resume>
-
 Generate a professional cover letter in LaTeX format using a simple
 letter document class. Reference only facts from the resume.
 Address to: {company}, for the role of {job_title}.
 """
+
+# Templates pre-split at import so hot-path formatting is plain string
+# concatenation instead of re-scanning for placeholders on every call.
+_RESUME_PRE, _RESUME_POST = PROMPT_COVER_LETTER_RESUME.split("{resume_json}")
+_TASK_PRE, _task_rest = PROMPT_COVER_LETTER_TASK.split("{jd_json}")
+_TASK_MID1, _task_rest = _task_rest.split("{company}")
+_TASK_MID2, _TASK_POST = _task_rest.split("{job_title}")
+
+
+def format_cover_letter_resume(resume_json: str) -> str:
+    """Fill the resume block template.
+
+    Args:
+        resume_json: Serialized resume IR.
+
+    Returns:
+        The resume content block.
+    """
+    return f"{_RESUME_PRE}{resume_json}{_RESUME_POST}"
+
+
+def format_cover_letter_task(jd_json: str, company: str, job_title: str) -> str:
+    """Fill the JD/task block template.
+
+    Args:
+        jd_json: Serialized job description.
+        company: Company the letter is addressed to.
+        job_title: Role the letter targets.
+
+    Returns:
+        The task content block.
+    """
+    return f"{_TASK_PRE}{jd_json}{_TASK_MID1}{company}{_TASK_MID2}{job_title}{_TASK_POST}"
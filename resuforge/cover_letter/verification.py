@@ -7,7 +7,48 @@ and credentials.
 
 from __future__ import annotations
 
-from resuforge.resume.ir_schema import ResumeIR
+import re
+
+from resuforge.resume.ir_schema import JDObject, ResumeIR
+
+# Capitalized mid-sentence terms (preceded by a lowercase word) are the
+# named-entity shape fabricated claims take — "worked at Globex",
+# "certified in Kubernetes", "joined Initech Solutions". Runs of
+# capitalized words are captured as one phrase so multi-word names like
+# "Stanford University" are checked whole. Sentence-initial capitals
+# are skipped.
+_NAMED_CLAIM_RE = re.compile(
+    r"(?<=[a-z]\s)"
+    r"[A-Z][A-Za-z0-9+#.-]{3,}[A-Za-z0-9+#]"
+    r"(?:\s[A-Z][A-Za-z0-9+#.-]*[A-Za-z0-9+#])*"
+)
+
+# Letter boilerplate that is capitalized by convention, not a claim.
+# Month names included: "Since January 2022" dates a grounded fact, it
+# doesn't fabricate one.
+_STOPWORDS = frozenset(
+    {
+        "dear",
+        "hiring",
+        "manager",
+        "sincerely",
+        "regards",
+        "thank",
+        "madam",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    }
+)
 
 
 class GroundingViolationError(Exception):
@@ -30,48 +71,129 @@ class GroundingViolationError(Exception):
         )
 
 
-def verify_grounding(letter_text: str, resume: ResumeIR) -> list[str]:
+class GroundingScanner:
+    """Incremental grounding checker fed streamed letter text.
+
+    Lets verification run while the LLM is still generating: each
+    delta is scanned as it settles, so by the time the final token
+    arrives only the trailing fragment is left to check and the full
+    O(N) verification pass drops off the serial latency path.
+
+    Deltas accumulate in a pending buffer; on each feed, text up to the
+    last sentence/line boundary is scanned and discarded (a claim still
+    growing at the stream frontier must not be judged early). Two chars
+    of settled context are retained so the lookbehind in the claim
+    regex sees across the cut.
+    """
+
+    def __init__(self, resume: ResumeIR, jd: JDObject | None = None) -> None:
+        """Initialize the scanner against a resume's vocabulary.
+
+        Args:
+            resume: Source resume IR to ground claims against.
+            jd: Parsed job description, when available. The prompt asks
+                the letter to address the JD's company and job title by
+                name, so those terms are allowed without being resume
+                claims.
+        """
+        self._vocab = resume.grounding_vocab
+        if jd is not None:
+            self._vocab = self._vocab | _jd_vocab(jd)
+        self._pending = ""
+        self._violations: set[str] = set()
+
+    def feed(self, delta: str) -> None:
+        """Consume a text delta, scanning any newly settled region.
+
+        Args:
+            delta: Next chunk of generated letter text.
+        """
+        self._pending += delta
+        cut = max(self._pending.rfind("\n"), self._pending.rfind(". "))
+        if cut < 0:
+            return
+        settled = self._pending[: cut + 2]
+        # Retain from one char before the cut so the claim regex's
+        # [a-z]\s lookbehind still sees both context chars when the
+        # next claim starts right at the cut (e.g. "with\nKubernetes").
+        self._pending = self._pending[max(cut - 1, 0) :]
+        self._scan(settled)
+
+    def finish(self) -> list[str]:
+        """Scan the trailing fragment and return all violations found.
+
+        Returns:
+            Sorted list of ungrounded claims. Empty means grounded.
+        """
+        self._scan(self._pending)
+        self._pending = ""
+        return sorted(self._violations)
+
+    def _scan(self, text: str) -> None:
+        """Extract claims from a settled region and record violations.
+
+        Args:
+            text: Region of letter text that will not grow further.
+        """
+        # Note: This is a lightweight heuristic check.
+        # The real grounding enforcement is in the system prompt.
+        # This verification catches obvious fabrications.
+        vocab = self._vocab
+        for m in _NAMED_CLAIM_RE.finditer(text):
+            claim = m.group(0).lower()
+            if claim in vocab or claim in _STOPWORDS:
+                continue
+            # A multi-word claim is grounded if each significant word is.
+            if all(
+                len(word) <= 4 or word in vocab or word in _STOPWORDS
+                for word in claim.split()
+            ):
+                continue
+            self._violations.add(claim)
+
+
+def _jd_vocab(jd: JDObject) -> frozenset[str]:
+    """Lowercased JD terms a letter may reference without fabricating.
+
+    Mirrors ResumeIR.grounding_vocab's normalization: each phrase is
+    added whole plus its significant (>4 char) words.
+
+    Args:
+        jd: The parsed job description.
+
+    Returns:
+        Allowed terms derived from the JD's company, title, and keywords.
+    """
+    vocab: set[str] = set()
+    for term in (jd.company, jd.job_title, *jd.keywords):
+        if not term:
+            continue
+        lowered = term.lower()
+        vocab.add(lowered)
+        for word in lowered.split():
+            if len(word) > 4:
+                vocab.add(word)
+    return frozenset(vocab)
+
+
+def verify_grounding(
+    letter_text: str, resume: ResumeIR, jd: JDObject | None = None
+) -> list[str]:
     """Check that all key claims in the cover letter are grounded in the resume.
 
     Verifies that company names, skills, and degree/school references
-    mentioned in the letter exist in the resume IR.
+    mentioned in the letter exist in the resume IR. Single-shot wrapper
+    around GroundingScanner for already-complete letters.
 
     Args:
         letter_text: Generated cover letter text (plain or LaTeX).
         resume: Source resume IR.
+        jd: Parsed job description, when available — its company, job
+            title, and keywords are allowed terms.
 
     Returns:
         List of violation strings. Empty list means all claims are grounded.
     """
-    violations: list[str] = []
-
-    # Build grounding sets from resume
-    known_companies = {e.company.lower() for e in resume.experience}
-    known_skills = set()
-    for cat in resume.skills:
-        for skill in cat.items:
-            known_skills.add(skill.lower())
-    known_schools = {e.school.lower() for e in resume.education}
-    known_degrees = {e.degree.lower() for e in resume.education}
-
-    # Build a set of all known terms
-    all_known = known_companies | known_skills | known_schools | known_degrees
-    # Add bullet text fragments for broader grounding
-    for entry in resume.experience:
-        for bullet in entry.bullets:
-            # Add significant words from bullets
-            for word in bullet.text.lower().split():
-                if len(word) > 4:
-                    all_known.add(word)
-    for entry in resume.projects:
-        all_known.add(entry.name.lower())
-        for bullet in entry.bullets:
-            for word in bullet.text.lower().split():
-                if len(word) > 4:
-                    all_known.add(word)
-
-    # Note: This is a lightweight heuristic check.
-    # The real grounding enforcement is in the system prompt.
-    # This verification catches obvious fabrications.
-
-    return violations
+    scanner = GroundingScanner(resume, jd)
+    scanner.feed(letter_text)
+    return scanner.finish()
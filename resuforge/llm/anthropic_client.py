@@ -6,15 +6,20 @@ Retry logic: 3 retries with exponential backoff on transient errors.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import os
+import random
 import time
+from collections.abc import AsyncIterator
 from typing import TypeVar
 
 import anthropic
+import httpx
 import instructor
 from pydantic import BaseModel
 
-from resuforge.llm.base import LLMProvider
+from resuforge.llm.base import LLMProvider, UserContent
 from resuforge.llm.exceptions import LLMError
 
 T = TypeVar("T", bound=BaseModel)
@@ -22,6 +27,124 @@ T = TypeVar("T", bound=BaseModel)
 DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Opt in to server-side prompt caching so repeated resume/JD blocks
+# marked with cache_control reuse the server's KV cache across calls.
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Shared connection pool so TCP/TLS sessions are reused across the
+# tailor + cover-letter calls instead of re-handshaking per client.
+POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+# Errors worth retrying. APIStatusError is included but only survives
+# _check_transient for 5xx responses; client errors escape immediately.
+RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.APIStatusError,
+)
+
+
+def _check_transient(exc: Exception) -> Exception:
+    """Pass transient errors through, raising LLMError for client errors.
+
+    Args:
+        exc: The exception caught by a retry loop.
+
+    Returns:
+        The exception, when retrying it makes sense.
+
+    Raises:
+        LLMError: For non-retryable API errors (4xx status codes).
+    """
+    # RateLimitError is a 429 APIStatusError subclass but always
+    # retryable, so it must be exempted from the 4xx escape.
+    if (
+        isinstance(exc, anthropic.APIStatusError)
+        and not isinstance(exc, anthropic.RateLimitError)
+        and exc.status_code < 500
+    ):
+        raise LLMError(
+            f"Anthropic API error: {exc.message}",
+            provider="anthropic",
+            status_code=exc.status_code,
+        ) from exc
+    return exc
+
+_GLOBAL_CLIENT: anthropic.Anthropic | None = None
+_GLOBAL_ASYNC: anthropic.AsyncAnthropic | None = None
+_GLOBAL_KEY: str | None = None
+
+
+def _invalidate_on_key_change(api_key: str) -> None:
+    """Drop pooled clients when the API key changes.
+
+    Args:
+        api_key: Key requested by the caller.
+    """
+    global _GLOBAL_CLIENT, _GLOBAL_ASYNC, _GLOBAL_KEY
+    if _GLOBAL_KEY is not None and _GLOBAL_KEY != api_key:
+        _GLOBAL_CLIENT = None
+        _GLOBAL_ASYNC = None
+    _GLOBAL_KEY = api_key
+
+
+def get_client(api_key: str) -> anthropic.Anthropic:
+    """Return the process-wide pooled sync SDK client.
+
+    Lazily created on first use; reused for every AnthropicClient so
+    keep-alive connections survive across pipeline stages.
+
+    Args:
+        api_key: Anthropic API key.
+
+    Returns:
+        The shared anthropic.Anthropic instance.
+    """
+    global _GLOBAL_CLIENT
+    _invalidate_on_key_change(api_key)
+    if _GLOBAL_CLIENT is None:
+        _GLOBAL_CLIENT = anthropic.Anthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultHttpxClient(limits=POOL_LIMITS),
+        )
+    return _GLOBAL_CLIENT
+
+
+def get_async_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return the process-wide pooled async SDK client.
+
+    Args:
+        api_key: Anthropic API key.
+
+    Returns:
+        The shared anthropic.AsyncAnthropic instance.
+    """
+    global _GLOBAL_ASYNC
+    _invalidate_on_key_change(api_key)
+    if _GLOBAL_ASYNC is None:
+        _GLOBAL_ASYNC = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=POOL_LIMITS),
+        )
+    return _GLOBAL_ASYNC
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close pooled clients at interpreter shutdown (best effort)."""
+    if _GLOBAL_CLIENT is not None:
+        _GLOBAL_CLIENT.close()
+    if _GLOBAL_ASYNC is not None:
+        try:
+            asyncio.run(_GLOBAL_ASYNC.close())
+        except (RuntimeError, ValueError):
+            # Event loop already running/closed, or the client was
+            # replaced by a test double — sockets are reclaimed by the
+            # OS at exit anyway.
+            pass
 
 
 class AnthropicClient(LLMProvider):
@@ -32,12 +155,22 @@ class AnthropicClient(LLMProvider):
     Retry logic: 3 retries with exponential backoff.
     """
 
-    def __init__(self, api_key: str | None = None, model: str | None = None) -> None:
+    supports_streaming = True
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
         """Initialize the Anthropic client.
 
         Args:
             api_key: Anthropic API key. Falls back to ANTHROPIC_API_KEY env var.
             model: Model identifier. Defaults to claude-3-5-sonnet-20241022.
+            max_concurrency: Cap on simultaneous async API calls. Keeps
+                fan-out (e.g. per-section tailoring) below Anthropic's
+                concurrent-connection limit instead of bursting into 429s.
 
         Raises:
             LLMError: If no API key is found.
@@ -50,23 +183,29 @@ class AnthropicClient(LLMProvider):
             )
 
         self._model = model or DEFAULT_MODEL
-        raw_client = anthropic.Anthropic(api_key=resolved_key)
-        self._client = instructor.from_anthropic(raw_client)
+        self._client = instructor.from_anthropic(get_client(resolved_key))
+        # Raw (un-instructored) async client for text streaming.
+        self._raw_async = get_async_client(resolved_key)
+        self._async_client = instructor.from_anthropic(self._raw_async)
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     def complete(
         self,
         *,
         system: str,
-        user: str,
+        user: UserContent,
         response_model: type[T],
         temperature: float = 0.3,
         max_tokens: int = 4000,
     ) -> T:
         """Send a completion request to Claude with structured output.
 
+        The system prompt is always marked cacheable; callers passing
+        structured content parts can mark further blocks themselves.
+
         Args:
             system: System prompt with instructions and constraints.
-            user: User prompt with the actual task content.
+            user: User prompt — a string or structured content parts.
             response_model: Pydantic model class for structured output.
             temperature: Sampling temperature (default 0.3 for precision).
             max_tokens: Maximum tokens in response.
@@ -84,40 +223,224 @@ class AnthropicClient(LLMProvider):
                 result: T = self._client.messages.create(
                     model=self._model,
                     max_tokens=max_tokens,
-                    system=system,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": system,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
                     messages=[{"role": "user", "content": user}],
                     response_model=response_model,
                     temperature=temperature,
+                    extra_headers=PROMPT_CACHING_HEADERS,
                 )
                 return result
-            except anthropic.RateLimitError as exc:
-                last_error = exc
-                _backoff(attempt)
-            except anthropic.APIStatusError as exc:
-                if exc.status_code >= 500:
-                    last_error = exc
-                    _backoff(attempt)
-                else:
-                    raise LLMError(
-                        f"Anthropic API error: {exc.message}",
-                        provider="anthropic",
-                        status_code=exc.status_code,
-                    ) from exc
-            except anthropic.APIConnectionError as exc:
-                last_error = exc
-                _backoff(attempt)
+            except RETRYABLE_ERRORS as exc:
+                last_error = _check_transient(exc)
+                _backoff(attempt, exc)
+
+        raise LLMError(
+            f"Anthropic API failed after {MAX_RETRIES} retries: {last_error}",
+            provider="anthropic",
+        )
+
+    async def acomplete(
+        self,
+        *,
+        system: str,
+        user: UserContent,
+        response_model: type[T],
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+    ) -> T:
+        """Async completion request to Claude with structured output.
+
+        Mirrors complete() using the AsyncAnthropic SDK client, with the
+        same retry/backoff policy (non-blocking sleeps).
+
+        Args:
+            system: System prompt with instructions and constraints.
+            user: User prompt — a string or structured content parts.
+            response_model: Pydantic model class for structured output.
+            temperature: Sampling temperature (default 0.3 for precision).
+            max_tokens: Maximum tokens in response.
+
+        Returns:
+            A validated instance of response_model.
+
+        Raises:
+            LLMError: If the API call fails after retries.
+        """
+        last_error: Exception | None = None
+
+        # Retries (including rate-limit backoff) run while holding the
+        # semaphore slot so a throttled call doesn't free capacity for
+        # new bursts against an already-limited API.
+        async with self._sem:
+            for attempt in range(MAX_RETRIES):
+                try:
+                    result: T = await self._async_client.messages.create(
+                        model=self._model,
+                        max_tokens=max_tokens,
+                        system=[
+                            {
+                                "type": "text",
+                                "text": system,
+                                "cache_control": {"type": "ephemeral"},
+                            }
+                        ],
+                        messages=[{"role": "user", "content": user}],
+                        response_model=response_model,
+                        temperature=temperature,
+                        extra_headers=PROMPT_CACHING_HEADERS,
+                    )
+                    return result
+                except RETRYABLE_ERRORS as exc:
+                    last_error = _check_transient(exc)
+                    await _abackoff(attempt, exc)
 
         raise LLMError(
             f"Anthropic API failed after {MAX_RETRIES} retries: {last_error}",
             provider="anthropic",
         )
 
+    async def astream(
+        self,
+        *,
+        system: str,
+        user: UserContent,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+    ) -> AsyncIterator[str]:
+        """Stream a plain-text completion, yielding deltas as they arrive.
+
+        Bypasses instructor (which needs the complete response for
+        validation) and talks to the raw SDK client, so callers can
+        process text while the model is still generating. Retries only
+        apply before the first delta is yielded — once output has been
+        handed to the caller a retry would duplicate it, so mid-stream
+        failures surface as LLMError immediately.
+
+        Args:
+            system: System prompt with instructions and constraints.
+            user: User prompt — a string or structured content parts.
+            temperature: Sampling temperature (default 0.3 for precision).
+            max_tokens: Maximum tokens in response.
+
+        Yields:
+            Text deltas in generation order.
+
+        Raises:
+            LLMError: If the API call fails after retries, or mid-stream.
+        """
+        last_error: Exception | None = None
+
+        async with self._sem:
+            for attempt in range(MAX_RETRIES):
+                yielded = False
+                try:
+                    async with self._raw_async.messages.stream(
+                        model=self._model,
+                        max_tokens=max_tokens,
+                        system=[
+                            {
+                                "type": "text",
+                                "text": system,
+                                "cache_control": {"type": "ephemeral"},
+                            }
+                        ],
+                        messages=[{"role": "user", "content": user}],
+                        temperature=temperature,
+                        extra_headers=PROMPT_CACHING_HEADERS,
+                    ) as stream:
+                        async for delta in stream.text_stream:
+                            yielded = True
+                            yield delta
+                    return
+                except RETRYABLE_ERRORS as exc:
+                    if yielded:
+                        raise LLMError(
+                            f"Anthropic stream interrupted: {exc}",
+                            provider="anthropic",
+                        ) from exc
+                    last_error = _check_transient(exc)
+                    await _abackoff(attempt, exc)
+
+        raise LLMError(
+            f"Anthropic API failed after {MAX_RETRIES} retries: {last_error}",
+            provider="anthropic",
+        )
+
+
+def _retry_after_seconds(exc: Exception | None) -> float | None:
+    """Read the server-advertised retry delay from an API error, if any.
+
+    Args:
+        exc: The exception raised by the SDK, or None.
+
+    Returns:
+        Delay in seconds from Retry-After/Retry-After-Ms, or None.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+
+    ms = headers.get("retry-after-ms")
+    if ms is not None:
+        try:
+            return float(ms) / 1000.0
+        except ValueError:
+            pass
+
+    seconds = headers.get("retry-after")
+    if seconds is not None:
+        try:
+            return float(seconds)
+        except ValueError:
+            pass
+
+    return None
+
+
+def _retry_delay(attempt: int, exc: Exception | None) -> float:
+    """Compute the wait before the next retry attempt.
+
+    Honors the server's Retry-After when present — sleeping any less
+    wastes the attempt, any more wastes quota. Otherwise uses jittered
+    exponential backoff so concurrent clients don't retry in lockstep.
+
+    Args:
+        attempt: Current attempt number (0-indexed).
+        exc: The exception that triggered the retry, or None.
+
+    Returns:
+        Delay in seconds, capped at MAX_BACKOFF_SECONDS.
+    """
+    advertised = _retry_after_seconds(exc)
+    if advertised is not None:
+        return min(advertised, MAX_BACKOFF_SECONDS)
+
+    ceiling = INITIAL_BACKOFF_SECONDS * (2**attempt) * 3
+    return min(MAX_BACKOFF_SECONDS, random.uniform(INITIAL_BACKOFF_SECONDS, ceiling))
+
+
+def _backoff(attempt: int, exc: Exception | None = None) -> None:
+    """Sleep before the next retry attempt.
+
+    Args:
+        attempt: Current attempt number (0-indexed).
+        exc: The exception that triggered the retry, or None.
+    """
+    time.sleep(_retry_delay(attempt, exc))
+
 
-def _backoff(attempt: int) -> None:
-    """Sleep with exponential backoff.
+async def _abackoff(attempt: int, exc: Exception | None = None) -> None:
+    """Sleep before the next retry attempt without blocking the event loop.
 
     Args:
         attempt: Current attempt number (0-indexed).
+        exc: The exception that triggered the retry, or None.
     """
-    delay = INITIAL_BACKOFF_SECONDS * (2**attempt)
-    time.sleep(delay)
+    await asyncio.sleep(_retry_delay(attempt, exc))
@@ -6,13 +6,20 @@ validated Pydantic models via the instructor library.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import TypeVar
 
 from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+# User content is either a plain prompt string or a list of structured
+# content parts (Messages API blocks), which lets callers mark stable
+# blocks with cache_control for server-side prompt caching.
+UserContent = str | list[dict[str, object]]
+
 
 class LLMProvider(ABC):
     """Abstract LLM provider interface.
@@ -22,12 +29,17 @@ class LLMProvider(ABC):
     a validated instance of that model.
     """
 
+    # Providers with a native token-streaming API set this True and
+    # override astream(); callers check it before choosing a streamed
+    # path (e.g. overlapping grounding verification with generation).
+    supports_streaming: bool = False
+
     @abstractmethod
     def complete(
         self,
         *,
         system: str,
-        user: str,
+        user: UserContent,
         response_model: type[T],
         temperature: float = 0.3,
         max_tokens: int = 4000,
@@ -36,7 +48,8 @@ class LLMProvider(ABC):
 
         Args:
             system: System prompt with instructions and constraints.
-            user: User prompt with the actual task content.
+            user: User prompt — a string, or structured content parts
+                with optional cache_control markers.
             response_model: Pydantic model class for structured output.
             temperature: Sampling temperature (default 0.3 for precision).
             max_tokens: Maximum tokens in response.
@@ -48,3 +61,71 @@ class LLMProvider(ABC):
             LLMError: If the API call fails after retries.
         """
         ...
+
+    async def acomplete(
+        self,
+        *,
+        system: str,
+        user: UserContent,
+        response_model: type[T],
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+    ) -> T:
+        """Async completion request to the LLM.
+
+        The default implementation runs the sync complete() in a worker
+        thread so every provider is usable from async pipelines.
+        Providers with a native async SDK should override this.
+
+        Args:
+            system: System prompt with instructions and constraints.
+            user: User prompt — a string, or structured content parts
+                with optional cache_control markers.
+            response_model: Pydantic model class for structured output.
+            temperature: Sampling temperature (default 0.3 for precision).
+            max_tokens: Maximum tokens in response.
+
+        Returns:
+            A validated instance of response_model.
+
+        Raises:
+            LLMError: If the API call fails after retries.
+        """
+        return await asyncio.to_thread(
+            lambda: self.complete(
+                system=system,
+                user=user,
+                response_model=response_model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        )
+
+    def astream(
+        self,
+        *,
+        system: str,
+        user: UserContent,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+    ) -> AsyncIterator[str]:
+        """Stream a plain-text completion as it is generated.
+
+        Only providers advertising supports_streaming implement this;
+        the base raises so an unguarded call fails loudly rather than
+        silently degrading.
+
+        Args:
+            system: System prompt with instructions and constraints.
+            user: User prompt — a string, or structured content parts
+                with optional cache_control markers.
+            temperature: Sampling temperature (default 0.3 for precision).
+            max_tokens: Maximum tokens in response.
+
+        Returns:
+            Async iterator over text deltas.
+
+        Raises:
+            NotImplementedError: If the provider has no streaming support.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
@@ -0,0 +1,267 @@
+"""Persistent disk cache for LLM completions.
+
+Completions are cached under ~/.resuforge/cache/ keyed by a SHA-256
+hash of the prompt, model, and response schema. Re-running the pipeline
+with unchanged inputs skips the network round-trip entirely.
+
+Entries expire after CACHE_TTL_SECONDS (mtime-based) so stale outputs
+don't survive model or prompt changes indefinitely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from resuforge.llm.base import LLMProvider, UserContent
+
+T = TypeVar("T", bound=BaseModel)
+
+CACHE_DIR = Path.home() / ".resuforge" / "cache"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # one week
+
+
+@lru_cache(maxsize=None)
+def _schema_repr(response_model: type[BaseModel]) -> str:
+    """Return the memoized schema representation of a response model.
+
+    pydantic regenerates the JSON schema on every model_json_schema()
+    call, which at ~0.1ms per call dominates key computation for
+    per-bullet tailoring fan-out. Schemas are fixed per class at
+    runtime, so one entry per response model is cached for the process.
+
+    Args:
+        response_model: Pydantic model class for structured output.
+
+    Returns:
+        Stable string form of the model's JSON schema.
+    """
+    return str(response_model.model_json_schema())
+
+
+def _cache_key(
+    system: str, user: UserContent, model: str, response_model: type[BaseModel]
+) -> str:
+    """Compute the content-addressed cache key for a completion request.
+
+    Args:
+        system: System prompt.
+        user: User prompt — string or structured content parts.
+        model: Model identifier.
+        response_model: Pydantic model class for structured output.
+
+    Returns:
+        Hex SHA-256 digest usable as a filename.
+    """
+    user_repr = user if isinstance(user, str) else json.dumps(user, sort_keys=True)
+    payload = "\x00".join((system, user_repr, model, _schema_repr(response_model)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_complete(
+    llm: LLMProvider,
+    *,
+    system: str,
+    user: UserContent,
+    response_model: type[T],
+    temperature: float = 0.3,
+    max_tokens: int = 4000,
+    namespace: str | None = None,
+) -> T:
+    """Complete via the LLM, consulting the disk cache first.
+
+    On a cache hit (entry present, valid, and younger than the TTL) the
+    stored JSON is validated through response_model and returned without
+    a network call. On a miss the real completion runs and its result is
+    written back to the cache.
+
+    Args:
+        llm: LLM provider to fall back to on cache miss.
+        system: System prompt with instructions and constraints.
+        user: User prompt with the actual task content.
+        response_model: Pydantic model class for structured output.
+        temperature: Sampling temperature (default 0.3 for precision).
+        max_tokens: Maximum tokens in response.
+        namespace: Optional subdirectory for the entry, so pipeline
+            stages with many small entries (e.g. per-section tailoring)
+            stay separable from one-off completions.
+
+    Returns:
+        A validated instance of response_model.
+
+    Raises:
+        LLMError: If the underlying API call fails after retries.
+    """
+    cache_path = _entry_path(llm, system, user, response_model, namespace)
+    hit = _load_entry(cache_path, response_model)
+    if hit is not None:
+        return hit
+
+    result = llm.complete(
+        system=system,
+        user=user,
+        response_model=response_model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
+    _store_entry(cache_path, result)
+    return result
+
+
+async def acached_complete(
+    llm: LLMProvider,
+    *,
+    system: str,
+    user: UserContent,
+    response_model: type[T],
+    temperature: float = 0.3,
+    max_tokens: int = 4000,
+    namespace: str | None = None,
+) -> T:
+    """Async twin of cached_complete, falling back to llm.acomplete.
+
+    Args:
+        llm: LLM provider to fall back to on cache miss.
+        system: System prompt with instructions and constraints.
+        user: User prompt with the actual task content.
+        response_model: Pydantic model class for structured output.
+        temperature: Sampling temperature (default 0.3 for precision).
+        max_tokens: Maximum tokens in response.
+        namespace: Optional subdirectory for the entry, so pipeline
+            stages with many small entries (e.g. per-section tailoring)
+            stay separable from one-off completions.
+
+    Returns:
+        A validated instance of response_model.
+
+    Raises:
+        LLMError: If the underlying API call fails after retries.
+    """
+    cache_path = _entry_path(llm, system, user, response_model, namespace)
+    hit = _load_entry(cache_path, response_model)
+    if hit is not None:
+        return hit
+
+    result = await llm.acomplete(
+        system=system,
+        user=user,
+        response_model=response_model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
+    _store_entry(cache_path, result)
+    return result
+
+
+def cache_lookup(
+    llm: LLMProvider,
+    *,
+    system: str,
+    user: UserContent,
+    response_model: type[T],
+) -> T | None:
+    """Look up a completion in the cache without falling back to the LLM.
+
+    For callers that obtain the completion through a path the cached_*
+    wrappers can't drive (e.g. token streaming) but still want cache
+    hits on repeat runs.
+
+    Args:
+        llm: LLM provider (its model identifier feeds the key).
+        system: System prompt.
+        user: User prompt — string or structured content parts.
+        response_model: Pydantic model class for structured output.
+
+    Returns:
+        The cached response, or None on miss/expiry/corruption.
+    """
+    return _load_entry(_entry_path(llm, system, user, response_model), response_model)
+
+
+def cache_store(
+    llm: LLMProvider,
+    *,
+    system: str,
+    user: UserContent,
+    response_model: type[T],
+    result: T,
+) -> None:
+    """Write a completion obtained out-of-band to the cache.
+
+    Args:
+        llm: LLM provider (its model identifier feeds the key).
+        system: System prompt.
+        user: User prompt — string or structured content parts.
+        response_model: Pydantic model class for structured output.
+        result: Validated response to persist.
+    """
+    _store_entry(_entry_path(llm, system, user, response_model), result)
+
+
+def _entry_path(
+    llm: LLMProvider,
+    system: str,
+    user: UserContent,
+    response_model: type[BaseModel],
+    namespace: str | None = None,
+) -> Path:
+    """Resolve the cache file path for a completion request.
+
+    Args:
+        llm: LLM provider (its model identifier feeds the key).
+        system: System prompt.
+        user: User prompt — string or structured content parts.
+        response_model: Pydantic model class for structured output.
+        namespace: Optional subdirectory for the entry.
+
+    Returns:
+        Path of the cache entry (may not exist yet).
+    """
+    model = getattr(llm, "_model", None) or type(llm).__name__
+    key = _cache_key(system, user, model, response_model)
+    directory = CACHE_DIR / namespace if namespace else CACHE_DIR
+    return directory / f"{key}.json"
+
+
+def _load_entry(cache_path: Path, response_model: type[T]) -> T | None:
+    """Load a cache entry if present, fresh, and valid.
+
+    Args:
+        cache_path: Path of the cache entry.
+        response_model: Pydantic model class to validate against.
+
+    Returns:
+        The cached response, or None on miss/expiry/corruption.
+    """
+    import time
+
+    if not cache_path.exists():
+        return None
+
+    age = time.time() - cache_path.stat().st_mtime
+    if age >= CACHE_TTL_SECONDS:
+        return None
+
+    try:
+        return response_model.model_validate_json(cache_path.read_text(encoding="utf-8"))
+    except ValidationError:
+        # Schema drift or corrupted entry — fall through to the API.
+        return None
+
+
+def _store_entry(cache_path: Path, result: BaseModel) -> None:
+    """Write a completion result to the cache.
+
+    Args:
+        cache_path: Path of the cache entry.
+        result: Validated response to persist.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(result.model_dump_json(), encoding="utf-8")
@@ -6,12 +6,20 @@ The IR is the single source of truth between parsing and rendering.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import sys
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Link(BaseModel):
     """A labeled hyperlink (GitHub, LinkedIn, portfolio, etc.)."""
 
+    # Immutable leaf model — frozen instances skip per-assignment
+    # bookkeeping and extra="forbid" keeps instances lean by refusing
+    # stray attributes.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     label: str
     url: str
 
@@ -33,6 +41,8 @@ class BulletPoint(BaseModel):
     e.g., 'exp_0_2' = experience entry 0, bullet 2.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     text: str
 
@@ -46,6 +56,14 @@ class ExperienceEntry(BaseModel):
     location: str | None = None
     bullets: list[BulletPoint] = Field(default_factory=list)
 
+    @field_validator("company", "title", "dates", "location", mode="after")
+    @classmethod
+    def _intern(cls, v: str | None) -> str | None:
+        """Intern field strings — these repeat heavily across entries
+        and tailoring iterations, so duplicates collapse to one object
+        and equality checks become pointer compares."""
+        return sys.intern(v) if isinstance(v, str) else v
+
 
 class EducationEntry(BaseModel):
     """A single education entry."""
@@ -63,6 +81,19 @@ class SkillCategory(BaseModel):
     category: str
     items: list[str]
 
+    @field_validator("category", mode="after")
+    @classmethod
+    def _intern_category(cls, v: str) -> str:
+        """Intern the category name — repeated across iterations."""
+        return sys.intern(v)
+
+    @field_validator("items", mode="after")
+    @classmethod
+    def _intern_items(cls, v: list[str]) -> list[str]:
+        """Intern skill strings — the same names recur in every
+        reorder response and gap-analysis comparison."""
+        return [sys.intern(item) for item in v]
+
 
 class ProjectEntry(BaseModel):
     """A single project entry."""
@@ -81,6 +112,10 @@ class ResumeIR(BaseModel):
     the tailoring engine modifies it, and the renderer consumes it.
     """
 
+    # Mutated in place by the tailoring engine, so not frozen — but
+    # unknown attributes are still refused.
+    model_config = ConfigDict(extra="forbid")
+
     preamble: str = ""
     header: HeaderSection = Field(default_factory=HeaderSection)
     summary: str | None = None
@@ -92,10 +127,62 @@ class ResumeIR(BaseModel):
     custom_commands: list[str] = Field(default_factory=list)
     section_order: list[str] = Field(default_factory=list)
 
+    @cached_property
+    def grounding_vocab(self) -> frozenset[str]:
+        """Lowercased terms a grounded cover letter may reference.
+
+        Contains company/skill/school/degree/project phrases plus every
+        significant word (>4 chars) from those phrases and from bullet
+        text. Computed once per IR and cached — grounding verification
+        runs a single set difference against it instead of re-walking
+        the whole resume per call.
+        """
+        vocab: set[str] = set()
+
+        def add_term(term: str) -> None:
+            lowered = term.lower()
+            vocab.add(lowered)
+            for word in lowered.split():
+                if len(word) > 4:
+                    vocab.add(word)
+
+        # Titles and dates are facts from the resume too — a letter
+        # saying "my role as <title> at <company> since <dates>" is
+        # grounded, not fabricated.
+        for entry in self.experience:
+            add_term(entry.company)
+            add_term(entry.title)
+            add_term(entry.dates)
+        for cat in self.skills:
+            for skill in cat.items:
+                add_term(skill)
+        for edu in self.education:
+            add_term(edu.school)
+            add_term(edu.degree)
+            add_term(edu.dates)
+        for project in self.projects:
+            add_term(project.name)
+            if project.dates:
+                add_term(project.dates)
+
+        # Bullet text is fused into one join + one C-level lower + one
+        # split instead of a per-bullet lower/split loop.
+        joined = "\n".join(
+            bullet.text
+            for source in (self.experience, self.projects)
+            for entry in source
+            for bullet in entry.bullets
+        )
+        vocab.update(word for word in joined.lower().split() if len(word) > 4)
+
+        return frozenset(vocab)
+
 
 class JDObject(BaseModel):
     """Structured representation of a parsed job description."""
 
+    model_config = ConfigDict(extra="forbid")
+
     raw_text: str
     job_title: str | None = None
     company: str | None = None
@@ -121,6 +208,8 @@ class Change(BaseModel):
     Every edit must be logged with its reason and the JD keyword that triggered it.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     section: str
     original: str
     modified: str
@@ -11,7 +11,10 @@ must pass for all supported templates.
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterator
+from functools import lru_cache, singledispatch
 from pathlib import Path
+from typing import Any
 
 from resuforge.resume.ir_schema import (
     BulletPoint,
@@ -44,21 +47,62 @@ SECTION_ALIASES: dict[str, str] = {
 
 # Regex patterns
 RE_DOCUMENTCLASS = re.compile(r"\\documentclass.*?\{.*?\}")
-RE_BEGIN_DOC = re.compile(r"\\begin\{document\}")
-RE_END_DOC = re.compile(r"\\end\{document\}")
 RE_SECTION = re.compile(r"\\section\*?\{(.+?)\}")
 RE_NEWCOMMAND = re.compile(r"\\(?:newcommand|renewcommand|def).*?(?:\n(?=\\)|$)", re.DOTALL)
 RE_HREF = re.compile(r"\\href\{([^}]+)\}\{([^}]+)\}")
 RE_TEXTBF = re.compile(r"\\textbf\{([^}]+)\}")
 RE_TEXTIT = re.compile(r"\\textit\{([^}]+)\}")
 RE_HFILL = re.compile(r"\\hfill\s*")
-RE_ITEM = re.compile(r"\\item\s+(.*?)(?=\\item|\Z)", re.DOTALL)
+# Items are found by scanning \item delimiters and slicing between
+# them — linear, unlike the old lazy .*? + lookahead capture, which
+# backtracked badly on large or malformed itemize bodies.
+RE_ITEM_DELIM = re.compile(r"\\item\s+")
 RE_ITEMIZE_BLOCK = re.compile(r"\\begin\{itemize\}.*?\n(.*?)\\end\{itemize\}", re.DOTALL)
 RE_EMAIL = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
 RE_PHONE = re.compile(r"\+?[\d][\d\s\-().]{6,}")
 RE_LARGE_NAME = re.compile(r"\{\\(?:LARGE|Huge|huge|HUGE|Large)\s+\\textbf\{([^}]+)\}\}")
 RE_RESUME_HEADING = re.compile(r"\\resumeHeading\{([^}]*)\}\{([^}]*)\}\{([^}]*)\}\{([^}]*)\}")
 RE_RESUME_SUBHEADING = re.compile(r"\\resumeSubheading\{([^}]*)\}\{([^}]*)\}")
+# Entry heads: \textbf with the \hfill confirmation folded into a
+# bounded lookahead, so qualification happens inside the regex engine
+# instead of a per-candidate Python substring check. The bounds
+# replicate the old fixed lookahead windows (20/20/30 chars, marker
+# fully inside); the wider project window covers its longer heading
+# line, and the experience marker is bare "hfill" as before.
+RE_EXP_ENTRY_HEAD = re.compile(r"\\textbf\{([^}]+)\}(?=(?s:.{0,15})hfill)")
+RE_EDU_ENTRY_HEAD = re.compile(r"\\textbf\{([^}]+)\}(?=(?s:.{0,14})\\hfill)")
+RE_PROJ_ENTRY_HEAD = re.compile(r"\\textbf\{([^}]+)\}(?=(?s:.{0,24})\\hfill)")
+RE_PHONE_TRAIL = re.compile(r"[^\d+\-() ]$")
+RE_LOC_LINE = re.compile(
+    r"(?:\\enspace\s*\|\s*\\enspace\s*|\\quad\s*|\|\s*)"
+    r"([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,}(?:\s|\\\\|$))"
+)
+RE_DATE_FULL = re.compile(
+    r"\\hfill\s*((?:\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)"
+    r"(?:\w*)?\.?\s+\d{4})\s*(?:--?|–|—|to)\s*(?:\d{4}|Present"
+    r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?:\w*)?\.?\s+\d{4}))"
+)
+RE_DATE_SIMPLE = re.compile(r"(\d{4}\s*(?:--?|–|—)\s*(?:\d{4}|Present))")
+RE_ENTRY_LOC = re.compile(r"\\hfill\s*(.+?)(?:\\\\|\s*$)")
+RE_PROJ_DATE = re.compile(r"\\hfill\s+(\d{4}(?:\s*--?\s*\d{4})?)\s*$")
+RE_SKILL_CATEGORY = re.compile(r"\\textbf\{([^}]+?):\}\s*(.+?)(?=\\textbf|$)", re.DOTALL)
+RE_NEWCOMMAND_FULL = re.compile(
+    r"(\\(?:newcommand|renewcommand)\{[^}]+\}(?:\[\d+\])?\{[^}]*(?:\{[^}]*\}[^}]*)*\})",
+    re.DOTALL,
+)
+RE_DEF_CMD = re.compile(r"(\\def\\[a-zA-Z]+.*?\{.*?\})", re.DOTALL)
+# All strip shapes fused into one alternation so the text is walked
+# once, with the callback dispatching on which branch matched, instead
+# of a fresh full-buffer pass per shape.
+RE_STRIP_ALL = re.compile(
+    r"\\text(?:bf|it|rm|sf|tt|sc)\{([^}]*)\}"
+    r"|\\emph\{([^}]*)\}"
+    r"|\\href\{[^}]*\}\{([^}]*)\}"
+    r"|\\(?:hfill|enspace|quad|qquad|noindent|vspace\{[^}]*\})"
+    r"|\\\\"
+    r"|\\%"
+)
+RE_STRIP_WS = re.compile(r"\s+")
 
 
 def parse_latex(source: str | Path) -> ResumeIR:
@@ -70,6 +114,11 @@ def parse_latex(source: str | Path) -> ResumeIR:
     Returns:
         A ResumeIR representing the structured resume content.
 
+    Results are memoized on the content string — preview and re-tailor
+    workflows parse the same resume repeatedly, and a hit skips the
+    whole regex pipeline. Callers receive a deep copy, keeping cached
+    instances safe from in-place tailoring mutation.
+
     Raises:
         FileNotFoundError: If source is a path that doesn't exist.
         ValueError: If the LaTeX content cannot be parsed.
@@ -77,67 +126,94 @@ def parse_latex(source: str | Path) -> ResumeIR:
     content = _read_source(source)
     if not content.strip():
         raise ValueError("LaTeX content is empty")
+    return _parse_latex_cached(content).model_copy(deep=True)
+
+
+@lru_cache(maxsize=32)
+def _parse_latex_cached(content: str) -> ResumeIR:
+    """Parse LaTeX content into a ResumeIR, memoized on the content.
 
+    Args:
+        content: Full LaTeX file content.
+
+    Returns:
+        A ResumeIR representing the structured resume content.
+    """
     preamble, body = _split_preamble(content)
     custom_commands = _extract_custom_commands(preamble)
+
+    # Fast path: no \section macros at all (partial fragments, preview
+    # input) — skip the section split and iteration outright.
+    if "\\section" not in body:
+        return ResumeIR(
+            preamble=preamble.strip(),
+            header=_parse_header(body, []),
+            custom_commands=custom_commands,
+        )
+
     sections = _split_into_sections(body)
 
     header = _parse_header(body, sections)
     section_order: list[str] = []
-    summary: str | None = None
-    experience: list[ExperienceEntry] = []
-    education: list[EducationEntry] = []
-    skills: list[SkillCategory] = []
-    projects: list[ProjectEntry] = []
     raw_sections: dict[str, str] = {}
+    parsed: dict[str, Any] = {}
 
     for section_name, section_content in sections:
         normalized = _normalize_section_name(section_name)
         section_order.append(normalized)
 
-        if normalized == "summary":
-            summary = _parse_summary(section_content)
-        elif normalized == "experience":
-            experience = _parse_experience(section_content)
-        elif normalized == "education":
-            education = _parse_education(section_content)
-        elif normalized == "skills":
-            skills = _parse_skills(section_content)
-        elif normalized == "projects":
-            projects = _parse_projects(section_content)
+        handler = _SECTION_DISPATCH.get(normalized)
+        if handler is not None:
+            parsed[normalized] = handler(section_content)
         else:
             raw_sections[normalized] = section_content.strip()
 
     return ResumeIR(
         preamble=preamble.strip(),
         header=header,
-        summary=summary,
-        experience=experience,
-        education=education,
-        skills=skills,
-        projects=projects,
+        summary=parsed.get("summary"),
+        experience=parsed.get("experience", []),
+        education=parsed.get("education", []),
+        skills=parsed.get("skills", []),
+        projects=parsed.get("projects", []),
         raw_sections=raw_sections,
         custom_commands=custom_commands,
         section_order=section_order,
     )
 
 
+@singledispatch
 def _read_source(source: str | Path) -> str:
     """Read LaTeX content from a file path or return string directly.
 
+    Dispatched on the source type — a dict lookup replacing the old
+    isinstance chain, with the string overload ordered so inline LaTeX
+    never pays for Path construction.
+
     Args:
         source: File path or LaTeX string.
 
     Returns:
         Raw LaTeX content as string.
     """
-    if isinstance(source, Path):
-        if not source.exists():
-            raise FileNotFoundError(f"Resume file not found: {source}")
-        return source.read_text(encoding="utf-8")
+    raise TypeError(f"Unsupported resume source type: {type(source).__name__}")
+
+
+@_read_source.register
+def _read_source_path(source: Path) -> str:
+    if not source.exists():
+        raise FileNotFoundError(f"Resume file not found: {source}")
+    return source.read_text(encoding="utf-8")
+
+
+@_read_source.register
+def _read_source_str(source: str) -> str:
+    # Fast path: starts with a backslash — LaTeX source, never a path.
+    if source.lstrip()[:1] == "\\":
+        return source
 
     # Check if string looks like a file path
-    if not source.strip().startswith("\\") and Path(source).suffix == ".tex":
+    if source.endswith(".tex"):
         path = Path(source)
         if path.exists():
             return path.read_text(encoding="utf-8")
@@ -155,15 +231,17 @@ def _split_preamble(content: str) -> tuple[str, str]:
     Returns:
         Tuple of (preamble, body) where body excludes begin/end document tags.
     """
-    match = RE_BEGIN_DOC.search(content)
-    if match is None:
+    # Pure literal anchors — str.find's two-way search beats spinning
+    # up the regex engine for them.
+    begin = content.find("\\begin{document}")
+    if begin < 0:
         return "", content
 
-    preamble = content[: match.start()].strip()
-    rest = content[match.end() :]
+    preamble = content[:begin].strip()
+    body_start = begin + len("\\begin{document}")
 
-    end_match = RE_END_DOC.search(rest)
-    body = rest[: end_match.start()] if end_match is not None else rest
+    end = content.find("\\end{document}", body_start)
+    body = content[body_start:end] if end >= 0 else content[body_start:]
 
     return preamble, body
 
@@ -177,20 +255,10 @@ def _extract_custom_commands(preamble: str) -> list[str]:
     Returns:
         List of custom command definition strings.
     """
-    commands: list[str] = []
     # Match \newcommand and \renewcommand with their full definitions
-    pattern = re.compile(
-        r"(\\(?:newcommand|renewcommand)\{[^}]+\}(?:\[\d+\])?\{[^}]*(?:\{[^}]*\}[^}]*)*\})",
-        re.DOTALL,
-    )
-    for match in pattern.finditer(preamble):
-        commands.append(match.group(1).strip())
-
+    commands = [m.group(1).strip() for m in RE_NEWCOMMAND_FULL.finditer(preamble)]
     # Also match \def commands
-    def_pattern = re.compile(r"(\\def\\[a-zA-Z]+.*?\{.*?\})", re.DOTALL)
-    for match in def_pattern.finditer(preamble):
-        commands.append(match.group(1).strip())
-
+    commands += [m.group(1).strip() for m in RE_DEF_CMD.finditer(preamble)]
     return commands
 
 
@@ -203,22 +271,29 @@ def _split_into_sections(body: str) -> list[tuple[str, str]]:
     Returns:
         List of (section_name, section_content) tuples.
     """
+    # One finditer pass carrying the previous match — no intermediate
+    # match list, no second walk to find each section's end.
     sections: list[tuple[str, str]] = []
-    matches = list(RE_SECTION.finditer(body))
+    prev: tuple[str, int] | None = None
 
-    for i, match in enumerate(matches):
-        section_name = match.group(1).strip()
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-        section_content = body[start:end]
-        sections.append((section_name, section_content))
+    for match in RE_SECTION.finditer(body):
+        if prev is not None:
+            sections.append((prev[0], body[prev[1] : match.start()]))
+        prev = (match.group(1).strip(), match.end())
+    if prev is not None:
+        sections.append((prev[0], body[prev[1] :]))
 
     return sections
 
 
+@lru_cache(maxsize=128)
 def _normalize_section_name(name: str) -> str:
     """Normalize a section name to a canonical form.
 
+    Memoized — the same handful of header strings recur across every
+    resume parsed in a process, so the strip/lower allocations and
+    alias lookup happen once per distinct name.
+
     Args:
         name: Raw section name from LaTeX.
 
@@ -269,6 +344,10 @@ def _extract_name(header_text: str) -> str:
     Returns:
         Extracted name string.
     """
+    # Both name shapes require \textbf — skip the regexes without it.
+    if "\\textbf" not in header_text:
+        return "Unknown"
+
     # Try {\LARGE \textbf{Name}} or {\huge \textbf{Name}} pattern
     match = RE_LARGE_NAME.search(header_text)
     if match:
@@ -308,7 +387,7 @@ def _extract_phone(header_text: str) -> str | None:
     if match:
         phone = match.group(0).strip()
         # Clean up trailing non-digit chars
-        phone = re.sub(r"[^\d+\-() ]$", "", phone).strip()
+        phone = RE_PHONE_TRAIL.sub("", phone).strip()
         return phone
     return None
 
@@ -326,19 +405,19 @@ def _extract_location(header_text: str) -> str | None:
     """
     # Look for City, State/Country pattern
     # Common: after last pipe/enspace separator on contact line
-    lines = header_text.split("\n")
-    for line in lines:
+    for line in header_text.splitlines():
+        # Literal prefilter: every separator the pattern accepts
+        # contains one of these substrings, so lines without them
+        # skip the regex entirely.
+        if "|" not in line and "\\enspace" not in line and "\\quad" not in line:
+            continue
         # Skip name line and link lines
         if (RE_LARGE_NAME.search(line) or "\\href" in line) and (
             "\\href" not in line or "|" not in line
         ):
             continue
         # Look for city, state pattern
-        loc_match = re.search(
-            r"(?:\\enspace\s*\|\s*\\enspace\s*|\\quad\s*|\|\s*)"
-            r"([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,}(?:\s|\\\\|$))",
-            line,
-        )
+        loc_match = RE_LOC_LINE.search(line)
         if loc_match:
             return loc_match.group(1).strip().rstrip("\\").strip()
 
@@ -354,12 +433,12 @@ def _extract_links(header_text: str) -> list[Link]:
     Returns:
         List of Link objects.
     """
-    links: list[Link] = []
-    for match in RE_HREF.finditer(header_text):
-        url = match.group(1)
-        label = match.group(2)
-        links.append(Link(label=label, url=url))
-    return links
+    if "\\href" not in header_text:
+        return []
+    return [
+        Link(label=match.group(2), url=match.group(1))
+        for match in RE_HREF.finditer(header_text)
+    ]
 
 
 def _parse_summary(content: str) -> str:
@@ -371,9 +450,9 @@ def _parse_summary(content: str) -> str:
     Returns:
         Cleaned summary text.
     """
-    text = _strip_latex_commands(content).strip()
-    # Remove leading/trailing whitespace and normalize
-    return " ".join(text.split())
+    # _strip_latex_commands already collapses runs of whitespace and
+    # strips the ends — no second normalization pass needed.
+    return _strip_latex_commands(content)
 
 
 def _parse_experience(content: str) -> list[ExperienceEntry]:
@@ -389,50 +468,47 @@ def _parse_experience(content: str) -> list[ExperienceEntry]:
     Returns:
         List of ExperienceEntry objects.
     """
-    # Try custom \resumeHeading format first
-    custom_matches = list(RE_RESUME_HEADING.finditer(content))
-    if custom_matches:
-        return _parse_experience_custom(content, custom_matches)
+    # Try custom \resumeHeading format first (substring check — no
+    # regex needed just to pick the format)
+    if "\\resumeHeading" in content:
+        return _parse_experience_custom(content)
 
     # Standard format: split by \textbf entries
     return _parse_experience_standard(content)
 
 
-def _parse_experience_custom(
-    content: str,
-    matches: list[re.Match[str]],
-) -> list[ExperienceEntry]:
+def _parse_experience_custom(content: str) -> list[ExperienceEntry]:
     """Parse experience entries using \\resumeHeading format.
 
     Args:
         content: Section content.
-        matches: Regex matches for resumeHeading.
 
     Returns:
         List of ExperienceEntry objects.
     """
     entries: list[ExperienceEntry] = []
-    for i, match in enumerate(matches):
-        title = match.group(1).strip()
-        dates = match.group(2).strip()
-        company = match.group(3).strip()
-        location = match.group(4).strip()
-
-        # Get bullets between this heading and the next
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-        block = content[start:end]
-        bullets = _extract_bullets(block, "exp", len(entries))
+    # One finditer pass carrying the previous heading; each entry's
+    # bullets live between its heading and the next.
+    prev: re.Match[str] | None = None
 
+    def _emit(match: re.Match[str], end: int) -> None:
+        block = content[match.end() : end]
         entries.append(
             ExperienceEntry(
-                company=company,
-                title=title,
-                dates=dates,
-                location=location or None,
-                bullets=bullets,
+                company=match.group(3).strip(),
+                title=match.group(1).strip(),
+                dates=match.group(2).strip(),
+                location=match.group(4).strip() or None,
+                bullets=_extract_bullets(block, "exp", len(entries)),
             )
         )
+
+    for match in RE_RESUME_HEADING.finditer(content):
+        if prev is not None:
+            _emit(prev, match.start())
+        prev = match
+    if prev is not None:
+        _emit(prev, len(content))
     return entries
 
 
@@ -445,39 +521,76 @@ def _parse_experience_standard(content: str) -> list[ExperienceEntry]:
     Returns:
         List of ExperienceEntry objects.
     """
-    entries: list[ExperienceEntry] = []
+    return _parse_entries(content, head_re=RE_EXP_ENTRY_HEAD, build=_build_experience_entry)
 
-    # Split on \textbf which marks entry starts
-    textbf_matches = list(RE_TEXTBF.finditer(content))
-    # Filter to only those that look like job titles (followed by \hfill)
-    entry_starts: list[int] = []
-    entry_titles: list[str] = []
-    for m in textbf_matches:
-        after = content[m.end() : m.end() + 20]
-        if "\\hfill" in after or "hfill" in after:
-            entry_starts.append(m.start())
-            entry_titles.append(m.group(1))
-
-    for i, (start, title) in enumerate(zip(entry_starts, entry_titles, strict=True)):
-        end = entry_starts[i + 1] if i + 1 < len(entry_starts) else len(content)
-        block = content[start:end]
-
-        dates = _extract_dates_from_line(block)
-        company = _extract_company(block)
-        location = _extract_entry_location(block)
-        bullets = _extract_bullets(block, "exp", len(entries))
 
-        entries.append(
-            ExperienceEntry(
-                company=company,
-                title=title,
-                dates=dates,
-                location=location,
-                bullets=bullets,
-            )
-        )
+def _build_experience_entry(title: str, block: str, idx: int) -> ExperienceEntry:
+    """Assemble one standard-format experience entry from its block.
 
-    return entries
+    Args:
+        title: Job title from the entry heading.
+        block: Text block for the entry.
+        idx: Entry index for bullet ID generation.
+
+    Returns:
+        Populated ExperienceEntry.
+    """
+    return ExperienceEntry(
+        company=_extract_company(block),
+        title=title,
+        dates=_extract_dates_from_line(block),
+        location=_extract_entry_location(block),
+        bullets=_extract_bullets(block, "exp", idx),
+    )
+
+
+def _parse_entries(
+    content: str,
+    *,
+    head_re: re.Pattern[str],
+    build: Callable[[str, str, int], Any],
+) -> list[Any]:
+    """Drive entry parsing for the standard \\textbf-headed sections.
+
+    One shared hot path for the experience, education, and project
+    parsers, which differ only in head pattern and the per-entry
+    fields their builder assembles.
+
+    Args:
+        content: Section content.
+        head_re: Entry-head pattern (RE_*_ENTRY_HEAD constant).
+        build: Builder turning (heading, block, index) into an entry.
+
+    Returns:
+        List of built entries in document order.
+    """
+    return [
+        build(head, block, idx)
+        for idx, (head, block) in enumerate(_iter_entry_blocks(content, head_re))
+    ]
+
+
+def _iter_entry_blocks(content: str, head_re: re.Pattern[str]) -> Iterator[tuple[str, str]]:
+    """Yield (heading, block) pairs for \\textbf-headed entries.
+
+    Walks the head pattern's matches once, carrying the previous head —
+    the \\hfill qualification lives in the pattern's lookahead, so no
+    per-candidate Python-level check remains.
+
+    Args:
+        content: Section content.
+        head_re: Entry-head pattern (RE_*_ENTRY_HEAD constant).
+
+    Yields:
+        (heading text, block from heading start to next heading) pairs.
+    """
+    prev: tuple[str, int] | None = None
+    for m in head_re.finditer(content):
+        if prev is not None:
+            yield prev[0], content[prev[1] : m.start()]
+        prev = (m.group(1), m.start())
+    if prev is not None:
+        yield prev[0], content[prev[1] :]
 
 
 def _extract_dates_from_line(block: str) -> str:
@@ -490,17 +603,12 @@ def _extract_dates_from_line(block: str) -> str:
         Date string (e.g., '2022 -- Present').
     """
     # Look for date patterns after \hfill
-    date_match = re.search(
-        r"\\hfill\s*((?:\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)"
-        r"(?:\w*)?\.?\s+\d{4})\s*(?:--?|–|—|to)\s*(?:\d{4}|Present"
-        r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?:\w*)?\.?\s+\d{4}))",
-        block,
-    )
+    date_match = RE_DATE_FULL.search(block)
     if date_match:
         return date_match.group(1).strip()
 
     # Try simpler year pattern
-    simple_match = re.search(r"(\d{4}\s*(?:--?|–|—)\s*(?:\d{4}|Present))", block)
+    simple_match = RE_DATE_SIMPLE.search(block)
     if simple_match:
         return simple_match.group(1).strip()
 
@@ -516,6 +624,8 @@ def _extract_company(block: str) -> str:
     Returns:
         Company name string.
     """
+    if "\\textit" not in block:
+        return ""
     match = RE_TEXTIT.search(block)
     if match:
         return match.group(1).strip()
@@ -532,10 +642,9 @@ def _extract_entry_location(block: str) -> str | None:
         Location string or None.
     """
     # Location typically on the \textit line after \hfill
-    lines = block.split("\n")
-    for line in lines:
+    for line in block.splitlines():
         if "\\textit" in line and "\\hfill" in line:
-            loc_match = re.search(r"\\hfill\s*(.+?)(?:\\\\|\s*$)", line)
+            loc_match = RE_ENTRY_LOC.search(line)
             if loc_match:
                 loc = loc_match.group(1).strip()
                 if loc and not loc.startswith("\\"):
@@ -559,15 +668,24 @@ def _extract_bullets(block: str, prefix: str, entry_idx: int) -> list[BulletPoin
     if not itemize_match:
         return bullets
 
-    items_text = itemize_match.group(1)
-    for item_match in RE_ITEM.finditer(items_text):
-        text = item_match.group(1).strip()
-        text = _strip_latex_commands(text)
-        text = " ".join(text.split())  # Normalize whitespace
+    def _emit(raw: str) -> None:
+        text = _strip_latex_commands(raw)
         if text:
             bullet_id = f"{prefix}_{entry_idx}_{len(bullets)}"
             bullets.append(BulletPoint(id=bullet_id, text=text))
 
+    # Scan \item delimiters in place via pos/endpos and slice each
+    # item's text between consecutive delimiters — no itemize-body
+    # copy, no backtracking capture.
+    body_end = itemize_match.end(1)
+    prev_end: int | None = None
+    for delim in RE_ITEM_DELIM.finditer(block, itemize_match.start(1), body_end):
+        if prev_end is not None:
+            _emit(block[prev_end : delim.start()])
+        prev_end = delim.end()
+    if prev_end is not None:
+        _emit(block[prev_end:body_end])
+
     return bullets
 
 
@@ -581,41 +699,31 @@ def _parse_education(content: str) -> list[EducationEntry]:
         List of EducationEntry objects.
     """
     # Try custom \resumeHeading format
-    custom_matches = list(RE_RESUME_HEADING.finditer(content))
-    if custom_matches:
-        return _parse_education_custom(custom_matches)
+    if "\\resumeHeading" in content:
+        return _parse_education_custom(content)
 
     # Standard format
     return _parse_education_standard(content)
 
 
-def _parse_education_custom(
-    matches: list[re.Match[str]],
-) -> list[EducationEntry]:
+def _parse_education_custom(content: str) -> list[EducationEntry]:
     """Parse education entries using \\resumeHeading format.
 
     Args:
-        matches: Regex matches for resumeHeading.
+        content: Section content.
 
     Returns:
         List of EducationEntry objects.
     """
-    entries: list[EducationEntry] = []
-    for match in matches:
-        degree = match.group(1).strip()
-        dates = match.group(2).strip()
-        school = match.group(3).strip()
-        location = match.group(4).strip()
-
-        entries.append(
-            EducationEntry(
-                school=school,
-                degree=degree,
-                dates=dates,
-                location=location or None,
-            )
+    return [
+        EducationEntry(
+            school=match.group(3).strip(),
+            degree=match.group(1).strip(),
+            dates=match.group(2).strip(),
+            location=match.group(4).strip() or None,
         )
-    return entries
+        for match in RE_RESUME_HEADING.finditer(content)
+    ]
 
 
 def _parse_education_standard(content: str) -> list[EducationEntry]:
@@ -627,40 +735,28 @@ def _parse_education_standard(content: str) -> list[EducationEntry]:
     Returns:
         List of EducationEntry objects.
     """
-    entries: list[EducationEntry] = []
-
-    textbf_matches = list(RE_TEXTBF.finditer(content))
-    entry_starts: list[int] = []
-    entry_degrees: list[str] = []
+    return _parse_entries(content, head_re=RE_EDU_ENTRY_HEAD, build=_build_education_entry)
 
-    for m in textbf_matches:
-        after = content[m.end() : m.end() + 20]
-        if "\\hfill" in after:
-            entry_starts.append(m.start())
-            entry_degrees.append(m.group(1))
 
-    for i, (start, degree) in enumerate(zip(entry_starts, entry_degrees, strict=True)):
-        end = entry_starts[i + 1] if i + 1 < len(entry_starts) else len(content)
-        block = content[start:end]
+def _build_education_entry(degree: str, block: str, idx: int) -> EducationEntry:
+    """Assemble one standard-format education entry from its block.
 
-        dates = _extract_dates_from_line(block)
-        school = _extract_company(block)  # Same \textit pattern
-        location = _extract_entry_location(block)
-
-        # Extract detail lines (non-empty lines after the header that aren't items)
-        details = _extract_education_details(block)
-
-        entries.append(
-            EducationEntry(
-                school=school,
-                degree=degree,
-                dates=dates,
-                location=location,
-                details=details,
-            )
-        )
+    Args:
+        degree: Degree name from the entry heading.
+        block: Text block for the entry.
+        idx: Entry index (unused — education entries have no bullets).
 
-    return entries
+    Returns:
+        Populated EducationEntry.
+    """
+    return EducationEntry(
+        school=_extract_company(block),  # Same \textit pattern
+        degree=degree,
+        dates=_extract_dates_from_line(block),
+        location=_extract_entry_location(block),
+        # Detail lines: non-empty lines after the header that aren't items
+        details=_extract_education_details(block),
+    )
 
 
 def _extract_education_details(block: str) -> list[str]:
@@ -673,10 +769,9 @@ def _extract_education_details(block: str) -> list[str]:
         List of detail strings.
     """
     details: list[str] = []
-    lines = block.strip().split("\n")
     # Skip the first two lines (degree+dates and school+location)
     header_count = 0
-    for line in lines:
+    for line in block.strip().splitlines():
         stripped = line.strip()
         if not stripped:
             continue
@@ -706,8 +801,7 @@ def _parse_skills(content: str) -> list[SkillCategory]:
     categories: list[SkillCategory] = []
 
     # Pattern: \textbf{Category:} items
-    skill_pattern = re.compile(r"\\textbf\{([^}]+?):\}\s*(.+?)(?=\\textbf|$)", re.DOTALL)
-    for match in skill_pattern.finditer(content):
+    for match in RE_SKILL_CATEGORY.finditer(content):
         category = match.group(1).strip()
         items_text = match.group(2).strip()
         # Clean up LaTeX artifacts
@@ -728,38 +822,28 @@ def _parse_projects(content: str) -> list[ProjectEntry]:
     Returns:
         List of ProjectEntry objects.
     """
-    entries: list[ProjectEntry] = []
-
-    # Find project headers: \textbf{Name} \hfill ...
-    textbf_matches = list(RE_TEXTBF.finditer(content))
-    entry_starts: list[int] = []
-    entry_names: list[str] = []
-
-    for m in textbf_matches:
-        # Projects have \hfill after name (for URL or date)
-        after = content[m.end() : m.end() + 30]
-        if "\\hfill" in after:
-            entry_starts.append(m.start())
-            entry_names.append(m.group(1))
+    # The wider window accommodates the longer project heading line
+    # (\textbf{Name} \hfill URL or date).
+    return _parse_entries(content, head_re=RE_PROJ_ENTRY_HEAD, build=_build_project_entry)
 
-    for i, (start, name) in enumerate(zip(entry_starts, entry_names, strict=True)):
-        end = entry_starts[i + 1] if i + 1 < len(entry_starts) else len(content)
-        block = content[start:end]
 
-        url = _extract_project_url(block)
-        dates = _extract_project_dates(block)
-        bullets = _extract_bullets(block, "proj", len(entries))
+def _build_project_entry(name: str, block: str, idx: int) -> ProjectEntry:
+    """Assemble one project entry from its block.
 
-        entries.append(
-            ProjectEntry(
-                name=name,
-                url=url,
-                dates=dates,
-                bullets=bullets,
-            )
-        )
+    Args:
+        name: Project name from the entry heading.
+        block: Text block for the entry.
+        idx: Entry index for bullet ID generation.
 
-    return entries
+    Returns:
+        Populated ProjectEntry.
+    """
+    return ProjectEntry(
+        name=name,
+        url=_extract_project_url(block),
+        dates=_extract_project_dates(block),
+        bullets=_extract_bullets(block, "proj", idx),
+    )
 
 
 def _extract_project_url(block: str) -> str | None:
@@ -771,6 +855,8 @@ def _extract_project_url(block: str) -> str | None:
     Returns:
         URL string or None.
     """
+    if "\\href" not in block:
+        return None
     match = RE_HREF.search(block)
     if match:
         return match.group(1)
@@ -786,9 +872,11 @@ def _extract_project_dates(block: str) -> str | None:
     Returns:
         Date string or None.
     """
-    # Check for a year after \hfill (but not a URL)
-    first_line = block.split("\n")[0]
-    date_match = re.search(r"\\hfill\s+(\d{4}(?:\s*--?\s*\d{4})?)\s*$", first_line)
+    # Check for a year after \hfill (but not a URL). Only the first
+    # line matters — slice it out instead of splitting the whole block.
+    newline = block.find("\n")
+    first_line = block if newline < 0 else block[:newline]
+    date_match = RE_PROJ_DATE.search(first_line)
     if date_match:
         return date_match.group(1).strip()
     return None
@@ -801,19 +889,49 @@ def _strip_latex_commands(text: str) -> str:
         text: LaTeX-formatted text.
 
     Returns:
-        Plain text with formatting stripped.
+        Plain text with formatting stripped. Guaranteed single-space
+        normalized and end-stripped — callers must not re-normalize.
     """
-    # Remove \textbf{...}, \textit{...}, etc. but keep content
-    text = re.sub(r"\\text(?:bf|it|rm|sf|tt|sc)\{([^}]*)\}", r"\1", text)
-    # Remove \emph{...}
-    text = re.sub(r"\\emph\{([^}]*)\}", r"\1", text)
-    # Remove \href{url}{label} -> label
-    text = re.sub(r"\\href\{[^}]*\}\{([^}]*)\}", r"\1", text)
-    # Remove standalone LaTeX commands like \hfill, \enspace, \\
-    text = re.sub(r"\\(?:hfill|enspace|quad|qquad|noindent|vspace\{[^}]*\})", " ", text)
-    text = text.replace("\\\\", " ")
-    # Remove \% -> %
-    text = text.replace("\\%", "%")
+    # Iterate to a fixpoint: nested wrappers like
+    # \textbf{\emph{x} y} truncate their [^}]* capture at the inner
+    # brace, leaving an unbalanced fragment only a later full-text pass
+    # can strip. Each substitution shortens the text, so this
+    # terminates, and unnested input settles on the second pass.
+    while True:
+        stripped = RE_STRIP_ALL.sub(_strip_repl, text)
+        if stripped == text:
+            break
+        text = stripped
     # Clean up multiple spaces
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    return RE_STRIP_WS.sub(" ", text).strip()
+
+
+def _strip_repl(m: re.Match[str]) -> str:
+    """Dispatch a RE_STRIP_ALL match to its replacement.
+
+    Wrapper commands (\\textbf, \\emph, \\href) keep their captured
+    content — the fixpoint loop in _strip_latex_commands picks up any
+    commands still inside it. Standalone commands and \\\\ become a
+    space; \\% becomes %.
+
+    Args:
+        m: A match from RE_STRIP_ALL.
+
+    Returns:
+        Replacement text for the matched command.
+    """
+    if m.lastindex:
+        return m.group(m.lastindex)
+    return "%" if m.group(0) == "\\%" else " "
+
+
+# Normalized section name → parser. One dict lookup per section in
+# parse_latex's main loop instead of a chain of string compares, and
+# new section types register here without touching the loop.
+_SECTION_DISPATCH: dict[str, Callable[[str], Any]] = {
+    "summary": _parse_summary,
+    "experience": _parse_experience,
+    "education": _parse_education,
+    "skills": _parse_skills,
+    "projects": _parse_projects,
+}
@@ -6,7 +6,12 @@ No state, no side effects. Renders into standard article-class format.
 
 from __future__ import annotations
 
+import io
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
 from resuforge.resume.ir_schema import (
+    BulletPoint,
     EducationEntry,
     ExperienceEntry,
     HeaderSection,
@@ -20,6 +25,13 @@ DEFAULT_PREAMBLE = r"""\documentclass[11pt]{article}
 \usepackage{hyperref}
 \usepackage{enumitem}"""
 
+# Shared literal fragments for the bullet-list writers.
+_ITEMIZE_OPEN = "\n\\begin{itemize}[leftmargin=*]"
+_ITEMIZE_CLOSE = "\n\\end{itemize}"
+
+# Separator between contact/link fragments on a header line.
+_CONTACT_SEP = r" \enspace | \enspace "
+
 # Maps normalized section names to display names
 SECTION_DISPLAY_NAMES: dict[str, str] = {
     "summary": "Summary",
@@ -33,107 +45,97 @@ SECTION_DISPLAY_NAMES: dict[str, str] = {
 def render_latex(ir: ResumeIR) -> str:
     """Render a ResumeIR back to a valid LaTeX string.
 
+    One StringIO buffer is threaded through all the section writers,
+    so output is written once — no per-section line lists joined and
+    re-joined at the top level.
+
     Args:
         ir: The structured resume intermediate representation.
 
     Returns:
         A compilable LaTeX string.
     """
-    parts: list[str] = []
+    buf = io.StringIO()
+    write = buf.write
 
     # Preamble
-    preamble = ir.preamble.strip() if ir.preamble else DEFAULT_PREAMBLE
-    parts.append(preamble)
-    parts.append("")
-    parts.append(r"\begin{document}")
-    parts.append("")
+    write(ir.preamble.strip() if ir.preamble else DEFAULT_PREAMBLE)
+    write("\n\n\\begin{document}\n\n")
 
     # Header
-    parts.append(_render_header(ir.header))
-    parts.append("")
+    _render_header(buf, ir.header)
+    write("\n\n")
 
     # Sections in order
-    rendered_sections = _get_section_order(ir)
-    for section_name in rendered_sections:
-        section_output = _render_section(ir, section_name)
-        if section_output:
-            parts.append(section_output)
-            parts.append("")
-
-    parts.append(r"\end{document}")
-    parts.append("")
+    for section_name in _iter_section_order(ir):
+        before = buf.tell()
+        _render_section(buf, ir, section_name)
+        if buf.tell() > before:
+            write("\n\n")
 
-    return "\n".join(parts)
+    write("\\end{document}\n")
+    return buf.getvalue()
 
 
-def _get_section_order(ir: ResumeIR) -> list[str]:
-    """Determine the rendering order for sections.
+def _iter_section_order(ir: ResumeIR) -> Iterator[str]:
+    """Yield section names in rendering order.
 
-    Uses section_order if available, otherwise builds a default order.
+    Uses section_order if available, otherwise yields a default order.
 
     Args:
         ir: The resume IR.
 
-    Returns:
-        Ordered list of section name strings.
+    Yields:
+        Section name strings.
     """
     if ir.section_order:
-        return ir.section_order
+        yield from ir.section_order
+        return
 
     # Default order based on what's populated
-    order: list[str] = []
     if ir.summary:
-        order.append("summary")
+        yield "summary"
     if ir.experience:
-        order.append("experience")
+        yield "experience"
     if ir.skills:
-        order.append("skills")
+        yield "skills"
     if ir.education:
-        order.append("education")
+        yield "education"
     if ir.projects:
-        order.append("projects")
-    for key in ir.raw_sections:
-        order.append(key)
-    return order
+        yield "projects"
+    yield from ir.raw_sections
+
 
+def _render_section(buf: io.StringIO, ir: ResumeIR, section_name: str) -> None:
+    """Render a single section by name into the buffer.
 
-def _render_section(ir: ResumeIR, section_name: str) -> str | None:
-    """Render a single section by name.
+    Writes nothing when the section is empty or unknown — the caller
+    detects that via the buffer position.
 
     Args:
+        buf: Output buffer.
         ir: The resume IR.
         section_name: Normalized section name.
-
-    Returns:
-        Rendered LaTeX string for the section, or None if empty.
     """
-    if section_name == "summary" and ir.summary:
-        return _render_summary(ir.summary)
-    elif section_name == "experience" and ir.experience:
-        return _render_experience(ir.experience)
-    elif section_name == "education" and ir.education:
-        return _render_education(ir.education)
-    elif section_name == "skills" and ir.skills:
-        return _render_skills(ir.skills)
-    elif section_name == "projects" and ir.projects:
-        return _render_projects(ir.projects)
+    renderer = _SECTION_RENDERERS.get(section_name)
+    if renderer is not None:
+        data = getattr(ir, section_name)
+        if data:
+            renderer(buf, data)
     elif section_name in ir.raw_sections:
-        return _render_raw_section(section_name, ir.raw_sections[section_name])
-    return None
+        _render_raw_section(buf, section_name, ir.raw_sections[section_name])
 
 
-def _render_header(header: HeaderSection) -> str:
-    """Render the header/contact section.
+def _render_header(buf: io.StringIO, header: HeaderSection) -> None:
+    """Render the header/contact section into the buffer.
 
     Args:
+        buf: Output buffer.
         header: Header data.
-
-    Returns:
-        LaTeX string for the header.
     """
-    lines: list[str] = []
-    lines.append(r"\begin{center}")
-    lines.append(rf"{{\LARGE \textbf{{{header.name}}}}} \\[4pt]")
+    write = buf.write
+    write("\\begin{center}\n")
+    write(rf"{{\LARGE \textbf{{{header.name}}}}} \\[4pt]")
 
     # Contact line
     contact_parts: list[str] = []
@@ -143,130 +145,149 @@ def _render_header(header: HeaderSection) -> str:
         contact_parts.append(header.phone)
     if header.location:
         contact_parts.append(header.location)
-    if contact_parts:
-        lines.append(r" \enspace | \enspace ".join(contact_parts) + r" \\")
+    if len(contact_parts) == 1:
+        write("\n" + contact_parts[0] + r" \\")
+    elif contact_parts:
+        write("\n" + _CONTACT_SEP.join(contact_parts) + r" \\")
 
     # Links line
     if header.links:
         link_parts = [rf"\href{{{link.url}}}{{{link.label}}}" for link in header.links]
-        lines.append(r" \enspace | \enspace ".join(link_parts))
+        write("\n" + _CONTACT_SEP.join(link_parts))
 
-    lines.append(r"\end{center}")
-    return "\n".join(lines)
+    write("\n\\end{center}")
 
 
-def _render_summary(summary: str) -> str:
-    """Render the summary section.
+def _render_summary(buf: io.StringIO, summary: str) -> None:
+    """Render the summary section into the buffer.
 
     Args:
+        buf: Output buffer.
         summary: Summary text.
-
-    Returns:
-        LaTeX string for the summary section.
     """
-    return f"\\section*{{Summary}}\n{summary}"
+    buf.write(f"\\section*{{Summary}}\n{summary}")
 
 
-def _render_experience(entries: list[ExperienceEntry]) -> str:
-    """Render the experience section.
+def _render_experience(buf: io.StringIO, entries: list[ExperienceEntry]) -> None:
+    """Render the experience section into the buffer.
 
     Args:
+        buf: Output buffer.
         entries: List of experience entries.
-
-    Returns:
-        LaTeX string for the experience section.
     """
-    lines: list[str] = [r"\section*{Experience}", ""]
-    for i, entry in enumerate(entries):
-        if i > 0:
-            lines.append("")
-        lines.append(rf"\textbf{{{entry.title}}} \hfill {entry.dates} \\")
+    write = buf.write
+    write("\\section*{Experience}")
+    for entry in entries:
+        write("\n\n")
+        write(rf"\textbf{{{entry.title}}} \hfill {entry.dates} \\")
         location = f" \\hfill {entry.location}" if entry.location else ""
-        lines.append(rf"\textit{{{entry.company}}}{location}")
-        if entry.bullets:
-            lines.append(r"\begin{itemize}[leftmargin=*]")
-            for bullet in entry.bullets:
-                lines.append(rf"    \item {bullet.text}")
-            lines.append(r"\end{itemize}")
-    return "\n".join(lines)
+        write(f"\n\\textit{{{entry.company}}}{location}")
+        _write_bullets(buf, entry.bullets)
 
 
-def _render_education(entries: list[EducationEntry]) -> str:
-    """Render the education section.
+def _render_education(buf: io.StringIO, entries: list[EducationEntry]) -> None:
+    """Render the education section into the buffer.
 
     Args:
+        buf: Output buffer.
         entries: List of education entries.
-
-    Returns:
-        LaTeX string for the education section.
     """
-    lines: list[str] = [r"\section*{Education}", ""]
-    for i, entry in enumerate(entries):
-        if i > 0:
-            lines.append("")
-        lines.append(rf"\textbf{{{entry.degree}}} \hfill {entry.dates} \\")
+    write = buf.write
+    write("\\section*{Education}")
+    for entry in entries:
+        write("\n\n")
+        write(rf"\textbf{{{entry.degree}}} \hfill {entry.dates} \\")
         location = f" \\hfill {entry.location}" if entry.location else ""
-        lines.append(rf"\textit{{{entry.school}}}{location}")
+        write(f"\n\\textit{{{entry.school}}}{location}")
         for detail in entry.details:
-            lines.append(rf"{detail}")
-    return "\n".join(lines)
+            write(f"\n{detail}")
 
 
-def _render_skills(categories: list[SkillCategory]) -> str:
-    """Render the skills section.
+def _render_skills(buf: io.StringIO, categories: list[SkillCategory]) -> None:
+    """Render the skills section into the buffer.
 
     Args:
+        buf: Output buffer.
         categories: List of skill categories.
-
-    Returns:
-        LaTeX string for the skills section.
     """
-    lines: list[str] = [r"\section*{Skills}"]
-    skill_lines: list[str] = []
-    for cat in categories:
-        items = ", ".join(cat.items)
-        skill_lines.append(rf"\textbf{{{cat.category}:}} {items}")
-    lines.append(" \\\\\n".join(skill_lines))
-    return "\n".join(lines)
+    write = buf.write
+    write("\\section*{Skills}\n")
+    for i, cat in enumerate(categories):
+        if i > 0:
+            write(" \\\\\n")
+        write(rf"\textbf{{{cat.category}:}} {', '.join(cat.items)}")
 
 
-def _render_projects(entries: list[ProjectEntry]) -> str:
-    """Render the projects section.
+def _render_projects(buf: io.StringIO, entries: list[ProjectEntry]) -> None:
+    """Render the projects section into the buffer.
 
     Args:
+        buf: Output buffer.
         entries: List of project entries.
-
-    Returns:
-        LaTeX string for the projects section.
     """
-    lines: list[str] = [r"\section*{Projects}", ""]
-    for i, entry in enumerate(entries):
-        if i > 0:
-            lines.append("")
+    write = buf.write
+    write("\\section*{Projects}")
+    for entry in entries:
+        write("\n\n")
         # Name with optional URL or dates
         right_side = ""
         if entry.url:
             right_side = rf"\href{{{entry.url}}}{{GitHub}}"
         elif entry.dates:
             right_side = entry.dates
-        lines.append(rf"\textbf{{{entry.name}}} \hfill {right_side}")
-        if entry.bullets:
-            lines.append(r"\begin{itemize}[leftmargin=*]")
-            for bullet in entry.bullets:
-                lines.append(rf"    \item {bullet.text}")
-            lines.append(r"\end{itemize}")
-    return "\n".join(lines)
+        write(rf"\textbf{{{entry.name}}} \hfill {right_side}")
+        _write_bullets(buf, entry.bullets)
+
+
+def _write_bullets(buf: io.StringIO, bullets: list[BulletPoint]) -> None:
+    """Write an itemize environment for an entry's bullets, if any.
+
+    Args:
+        buf: Output buffer.
+        bullets: BulletPoint list (may be empty — writes nothing).
+    """
+    if not bullets:
+        return
+    write = buf.write
+    write(_ITEMIZE_OPEN)
+    for bullet in bullets:
+        write(f"\n    \\item {bullet.text}")
+    write(_ITEMIZE_CLOSE)
 
 
-def _render_raw_section(name: str, content: str) -> str:
-    """Render a raw (unknown) section verbatim.
+def _render_raw_section(buf: io.StringIO, name: str, content: str) -> None:
+    """Render a raw (unknown) section verbatim into the buffer.
 
     Args:
+        buf: Output buffer.
         name: Normalized section name.
         content: Raw section content.
+    """
+    buf.write(f"\\section*{{{_display_name(name)}}}\n{content}")
+
+
+@lru_cache(maxsize=256)
+def _display_name(name: str) -> str:
+    """Title-case a normalized section name for display.
+
+    Memoized — batch renders hit the same handful of custom section
+    names over and over.
+
+    Args:
+        name: Normalized section name.
 
     Returns:
-        LaTeX string with section header and verbatim content.
+        Display-ready section title.
     """
-    display_name = name.replace("_", " ").title()
-    return f"\\section*{{{display_name}}}\n{content}"
+    return name.replace("_", " ").title()
+
+
+# Section name -> writer for the matching ResumeIR attribute. Lives at
+# the bottom so the writers are defined when the table is built.
+_SECTION_RENDERERS: dict[str, Callable[[io.StringIO, Any], None]] = {
+    "summary": _render_summary,
+    "experience": _render_experience,
+    "education": _render_education,
+    "skills": _render_skills,
+    "projects": _render_projects,
+}
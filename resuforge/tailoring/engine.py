@@ -6,26 +6,42 @@ a TailoringResult with tracked changes.
 
 from __future__ import annotations
 
-import copy
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from pydantic import BaseModel, Field
 
 from resuforge.llm.base import LLMProvider
+from resuforge.llm.cache import acached_complete, cached_complete
 from resuforge.resume.ir_schema import (
     BulletPoint,
     Change,
+    ExperienceEntry,
+    GapAnalysis,
     JDObject,
     ResumeIR,
     SkillCategory,
     TailoringResult,
 )
 from resuforge.tailoring.prompts import (
-    PROMPT_BULLET_REPHRASE,
+    PROMPT_BULLETS_BATCH_REPHRASE,
     PROMPT_SKILLS_REORDER,
     PROMPT_SUMMARY_REWRITE,
     SYSTEM_TAILORING,
 )
-from resuforge.tailoring.semantic_diff import compute_gap_analysis
+from resuforge.tailoring.semantic_diff import (
+    TAILOR_CACHE_NAMESPACE,
+    acompute_gap_analysis,
+    compute_gap_analysis,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Concurrent bullet-rephrase calls in the sync pipeline. The GIL is
+# released for the duration of each HTTP round-trip, so threads overlap
+# the latency without true parallelism concerns.
+MAX_BULLET_WORKERS = 8
 
 
 class SummaryResponse(BaseModel):
@@ -37,13 +53,20 @@ class SummaryResponse(BaseModel):
 
 
 class BulletResponse(BaseModel):
-    """LLM response for bullet rephrase."""
+    """Single rephrased bullet within a batch response."""
 
+    id: str = ""
     text: str
     reason: str = ""
     jd_keyword: str = ""
 
 
+class BulletBatchResponse(BaseModel):
+    """LLM response for one experience entry's batched bullet rephrase."""
+
+    bullets: list[BulletResponse] = Field(default_factory=list)
+
+
 class SkillsReorderResponse(BaseModel):
     """LLM response for skills reordering."""
 
@@ -62,6 +85,7 @@ def tailor_resume(
     jd: JDObject,
     *,
     llm: LLMProvider,
+    use_cache: bool = True,
 ) -> TailoringResult:
     """Tailor a resume to match a job description.
 
@@ -76,28 +100,99 @@ def tailor_resume(
         resume: The parsed resume IR.
         jd: The parsed job description.
         llm: LLM provider for generation.
+        use_cache: Whether to consult the per-section disk cache.
+
+    The four steps touch disjoint parts of the IR and have no data
+    dependency on each other, so they fan out across a small thread
+    pool — LLM latency dominates and the GIL is released during each
+    HTTP call, bringing wall time to roughly the slowest section.
 
     Returns:
         A TailoringResult containing the modified resume and change log.
     """
-    modified = copy.deepcopy(resume)
+    modified = resume.model_copy(deep=True)
     changes: list[Change] = []
+    # One JD serialization shared by every section prompt.
+    jd_json = jd.model_dump_json()
+    jd_keywords = tuple(k.lower() for k in jd.keywords)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        gap_future = ex.submit(compute_gap_analysis, resume, jd, llm=llm, use_cache=use_cache)
+
+        def _summary_task() -> Change | None:
+            # Waits on the gap future so a well-matched summary can skip
+            # its LLM round-trip entirely.
+            return _rewrite_summary(modified, jd_json, gap_future.result(), llm, use_cache)
+
+        summary_future = ex.submit(_summary_task)
+        skills_future = ex.submit(_reorder_skills, modified, jd_json, llm, use_cache)
+        bullets_future = ex.submit(
+            _rephrase_bullets, modified, jd_json, jd_keywords, llm, use_cache
+        )
 
-    # Step 1: Gap analysis
-    gap_analysis = compute_gap_analysis(resume, jd, llm=llm)
-
-    # Step 2: Rewrite summary (if present)
-    if modified.summary:
-        summary_change = _rewrite_summary(modified, jd, llm)
+        gap_analysis = gap_future.result()
+        summary_change = summary_future.result()
         if summary_change:
             changes.append(summary_change)
+        changes.extend(skills_future.result())
+        changes.extend(bullets_future.result())
 
-    # Step 3: Reorder skills
-    skill_changes = _reorder_skills(modified, jd, llm)
-    changes.extend(skill_changes)
+    return TailoringResult(
+        resume=modified,
+        changes=changes,
+        gap_analysis=gap_analysis,
+    )
 
-    # Step 4: Rephrase experience bullets
-    bullet_changes = _rephrase_bullets(modified, jd, llm)
+
+async def atailor_resume(
+    resume: ResumeIR,
+    jd: JDObject,
+    *,
+    llm: LLMProvider,
+    use_cache: bool = True,
+) -> TailoringResult:
+    """Async twin of tailor_resume with section-level parallelism.
+
+    Gap analysis, summary rewrite, skills reorder, and bullet rephrasing
+    touch disjoint parts of the IR, so they fan out via asyncio.gather
+    (bounded by the provider's concurrency semaphore) — wall time drops
+    to roughly the slowest section instead of the sum. Header and
+    education pass through untouched, as in the sync pipeline.
+
+    Args:
+        resume: The parsed resume IR.
+        jd: The parsed job description.
+        llm: LLM provider for generation.
+        use_cache: Whether to consult the per-section disk cache.
+
+    Returns:
+        A TailoringResult containing the modified resume and change log.
+    """
+    modified = resume.model_copy(deep=True)
+    # One JD serialization shared by every section prompt.
+    jd_json = jd.model_dump_json()
+    jd_keywords = tuple(k.lower() for k in jd.keywords)
+
+    gap_task = asyncio.ensure_future(
+        acompute_gap_analysis(resume, jd, llm=llm, use_cache=use_cache)
+    )
+
+    async def _summary_task() -> Change | None:
+        # Waits on the gap task so a well-matched summary can skip its
+        # LLM round-trip entirely.
+        return await _arewrite_summary(modified, jd_json, await gap_task, llm, use_cache)
+
+    gap_analysis, summary_change, skill_changes, bullet_changes = await asyncio.gather(
+        gap_task,
+        _summary_task(),
+        _areorder_skills(modified, jd_json, llm, use_cache),
+        _arephrase_bullets(modified, jd_json, jd_keywords, llm, use_cache),
+    )
+
+    changes: list[Change] = []
+    if summary_change:
+        changes.append(summary_change)
+    changes.extend(skill_changes)
     changes.extend(bullet_changes)
 
     return TailoringResult(
@@ -107,43 +202,208 @@ def tailor_resume(
     )
 
 
+def _complete(
+    llm: LLMProvider,
+    user: str,
+    response_model: type[T],
+    use_cache: bool,
+) -> T:
+    """Run a tailoring completion, via the section cache when enabled.
+
+    Args:
+        llm: LLM provider.
+        user: Formatted user prompt.
+        response_model: Pydantic model class for structured output.
+        use_cache: Whether to consult the per-section disk cache.
+
+    Returns:
+        A validated instance of response_model.
+    """
+    if use_cache:
+        return cached_complete(
+            llm,
+            system=SYSTEM_TAILORING,
+            user=user,
+            response_model=response_model,
+            namespace=TAILOR_CACHE_NAMESPACE,
+        )
+    return llm.complete(
+        system=SYSTEM_TAILORING,
+        user=user,
+        response_model=response_model,
+    )
+
+
+async def _acomplete(
+    llm: LLMProvider,
+    user: str,
+    response_model: type[T],
+    use_cache: bool,
+) -> T:
+    """Async twin of _complete.
+
+    Args:
+        llm: LLM provider.
+        user: Formatted user prompt.
+        response_model: Pydantic model class for structured output.
+        use_cache: Whether to consult the per-section disk cache.
+
+    Returns:
+        A validated instance of response_model.
+    """
+    if use_cache:
+        return await acached_complete(
+            llm,
+            system=SYSTEM_TAILORING,
+            user=user,
+            response_model=response_model,
+            namespace=TAILOR_CACHE_NAMESPACE,
+        )
+    return await llm.acomplete(
+        system=SYSTEM_TAILORING,
+        user=user,
+        response_model=response_model,
+    )
+
+
 def _rewrite_summary(
     ir: ResumeIR,
-    jd: JDObject,
+    jd_json: str,
+    gap_analysis: GapAnalysis,
     llm: LLMProvider,
+    use_cache: bool,
 ) -> Change | None:
     """Rewrite the summary section for JD alignment.
 
     Args:
         ir: Resume IR (modified in-place).
-        jd: Job description.
+        jd_json: Pre-serialized JD JSON.
+        gap_analysis: Gap analysis for the resume/JD pair.
         llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
 
     Returns:
         Change object if summary was modified, None otherwise.
     """
     if not ir.summary:
         return None
+    if not _summary_needs_rewrite(ir.summary, gap_analysis):
+        return None
 
     original = ir.summary
-    jd_json = jd.model_dump_json(indent=2)
-    resume_json = ir.model_dump_json(indent=2)
+    response = _complete(llm, _summary_prompt(ir, jd_json, original), SummaryResponse, use_cache)
+    return _apply_summary(ir, original, response)
+
+
+async def _arewrite_summary(
+    ir: ResumeIR,
+    jd_json: str,
+    gap_analysis: GapAnalysis,
+    llm: LLMProvider,
+    use_cache: bool,
+) -> Change | None:
+    """Async twin of _rewrite_summary.
+
+    Args:
+        ir: Resume IR (modified in-place).
+        jd_json: Pre-serialized JD JSON.
+        gap_analysis: Gap analysis for the resume/JD pair.
+        llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
+
+    Returns:
+        Change object if summary was modified, None otherwise.
+    """
+    if not ir.summary:
+        return None
+    if not _summary_needs_rewrite(ir.summary, gap_analysis):
+        return None
+
+    original = ir.summary
+    response = await _acomplete(
+        llm, _summary_prompt(ir, jd_json, original), SummaryResponse, use_cache
+    )
+    return _apply_summary(ir, original, response)
+
+
+def _summary_needs_rewrite(summary: str, gap_analysis: GapAnalysis) -> bool:
+    """Decide whether the summary rewrite is worth an LLM round-trip.
 
-    user_prompt = PROMPT_SUMMARY_REWRITE.format(
+    A resume that already covers everything the gap analysis surfaced
+    has nothing for the rewrite to pull in, so the multi-second call is
+    skipped outright.
+
+    Args:
+        summary: Current summary text.
+        gap_analysis: Gap analysis for the resume/JD pair.
+
+    Returns:
+        True when the gap analysis surfaced anything not already in the
+        summary text.
+    """
+    lowered = summary.lower()
+    return any(
+        item.lower() not in lowered
+        for item in gap_analysis.gaps + gap_analysis.opportunities
+    )
+
+
+def _summary_prompt(ir: ResumeIR, jd_json: str, original: str) -> str:
+    """Build the summary-rewrite user prompt.
+
+    Args:
+        ir: Resume IR.
+        jd_json: Pre-serialized JD JSON.
+        original: Current summary text.
+
+    Returns:
+        Formatted user prompt.
+    """
+    return PROMPT_SUMMARY_REWRITE.format(
         jd_json=jd_json,
         summary=original,
-        resume_json=resume_json,
+        resume_json=_compact_resume_context(ir),
     )
 
-    response = llm.complete(
-        system=SYSTEM_TAILORING,
-        user=user_prompt,
-        response_model=SummaryResponse,
-    )
 
+def _compact_resume_context(ir: ResumeIR) -> str:
+    """Serialize a compact grounding context for the summary prompt.
+
+    The summary rewrite only needs to know what the resume covers, not
+    every bullet — shipping the full IR JSON inflated the prompt token
+    count (and with it LLM latency and cost) several-fold.
+
+    Args:
+        ir: Resume IR.
+
+    Returns:
+        JSON string with experience titles, skill categories, and degrees.
+    """
+    import json
+
+    ctx = {
+        "experience_titles": [e.title for e in ir.experience],
+        "skill_categories": [s.category for s in ir.skills],
+        "education_degrees": [e.degree for e in ir.education],
+    }
+    return json.dumps(ctx, indent=2)
+
+
+def _apply_summary(ir: ResumeIR, original: str, response: SummaryResponse) -> Change | None:
+    """Apply a summary-rewrite response to the IR.
+
+    Args:
+        ir: Resume IR (modified in-place).
+        original: Summary text before the rewrite.
+        response: LLM response.
+
+    Returns:
+        Change object if summary was modified, None otherwise.
+    """
     if response.summary and response.summary != original:
         ir.summary = response.summary
-        return Change(
+        # Fields are already-validated strings, so skip re-validation.
+        return Change.model_construct(
             section="summary",
             original=original,
             modified=response.summary,
@@ -156,15 +416,17 @@ def _rewrite_summary(
 
 def _reorder_skills(
     ir: ResumeIR,
-    jd: JDObject,
+    jd_json: str,
     llm: LLMProvider,
+    use_cache: bool,
 ) -> list[Change]:
     """Reorder skills within each category to prioritize JD-relevant ones.
 
     Args:
         ir: Resume IR (modified in-place).
-        jd: Job description.
+        jd_json: Pre-serialized JD JSON.
         llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
 
     Returns:
         List of changes for reordered categories.
@@ -172,20 +434,61 @@ def _reorder_skills(
     if not ir.skills:
         return []
 
-    changes: list[Change] = []
-    jd_json = jd.model_dump_json(indent=2)
-    skills_json = _skills_to_json(ir.skills)
+    response = _complete(llm, _skills_prompt(ir, jd_json), SkillsReorderResponse, use_cache)
+    return _apply_skills(ir, response)
+
+
+async def _areorder_skills(
+    ir: ResumeIR,
+    jd_json: str,
+    llm: LLMProvider,
+    use_cache: bool,
+) -> list[Change]:
+    """Async twin of _reorder_skills.
+
+    Args:
+        ir: Resume IR (modified in-place).
+        jd_json: Pre-serialized JD JSON.
+        llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
 
-    user_prompt = PROMPT_SKILLS_REORDER.format(
+    Returns:
+        List of changes for reordered categories.
+    """
+    if not ir.skills:
+        return []
+
+    response = await _acomplete(llm, _skills_prompt(ir, jd_json), SkillsReorderResponse, use_cache)
+    return _apply_skills(ir, response)
+
+
+def _skills_prompt(ir: ResumeIR, jd_json: str) -> str:
+    """Build the skills-reorder user prompt.
+
+    Args:
+        ir: Resume IR.
+        jd_json: Pre-serialized JD JSON.
+
+    Returns:
+        Formatted user prompt.
+    """
+    return PROMPT_SKILLS_REORDER.format(
         jd_json=jd_json,
-        skills_json=skills_json,
+        skills_json=_skills_to_json(ir.skills),
     )
 
-    response = llm.complete(
-        system=SYSTEM_TAILORING,
-        user=user_prompt,
-        response_model=SkillsReorderResponse,
-    )
+
+def _apply_skills(ir: ResumeIR, response: SkillsReorderResponse) -> list[Change]:
+    """Apply a skills-reorder response to the IR.
+
+    Args:
+        ir: Resume IR (modified in-place).
+        response: LLM response.
+
+    Returns:
+        List of changes for reordered categories.
+    """
+    changes: list[Change] = []
 
     if response.categories:
         for i, cat_response in enumerate(response.categories):
@@ -194,8 +497,10 @@ def _reorder_skills(
             original_cat = ir.skills[i]
             new_items = cat_response.items
 
-            # Verify no skills added or removed
-            if set(new_items) == set(original_cat.items) and new_items != original_cat.items:
+            # Verify no skills added or removed — sorted comparison
+            # skips building two transient sets and, unlike set equality,
+            # also rejects duplicated or dropped repeats.
+            if sorted(new_items) == sorted(original_cat.items) and new_items != original_cat.items:
                 original_str = ", ".join(original_cat.items)
                 modified_str = ", ".join(new_items)
                 ir.skills[i] = SkillCategory(
@@ -203,7 +508,7 @@ def _reorder_skills(
                     items=new_items,
                 )
                 changes.append(
-                    Change(
+                    Change.model_construct(
                         section="skills",
                         original=f"{original_cat.category}: {original_str}",
                         modified=f"{original_cat.category}: {modified_str}",
@@ -216,56 +521,202 @@ def _reorder_skills(
 
 def _rephrase_bullets(
     ir: ResumeIR,
-    jd: JDObject,
+    jd_json: str,
+    jd_keywords: tuple[str, ...],
     llm: LLMProvider,
+    use_cache: bool,
 ) -> list[Change]:
     """Rephrase experience bullets to better match JD language.
 
     Args:
         ir: Resume IR (modified in-place).
-        jd: Job description.
+        jd_json: Pre-serialized JD JSON.
+        jd_keywords: Lowercased JD keywords, for the skip check.
+        llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
+
+    An entry's pending bullets go out in one completion — one request per
+    entry instead of one per bullet — and entries fan out across a thread
+    pool; results apply back by bullet id. Bullets that already contain
+    every JD keyword are left out of the batch entirely.
+
+    Returns:
+        List of changes for rephrased bullets.
+    """
+    tasks = _pending_bullet_batches(ir, jd_keywords)
+    if not tasks:
+        return []
+
+    def _call(task: tuple[ExperienceEntry, list[BulletPoint]]) -> BulletBatchResponse:
+        entry, bullets = task
+        return _complete(
+            llm, _bullets_prompt(jd_json, entry, bullets), BulletBatchResponse, use_cache
+        )
+
+    with ThreadPoolExecutor(max_workers=min(MAX_BULLET_WORKERS, len(tasks))) as ex:
+        # ex.map preserves submission order, so responses line up with
+        # their entries.
+        responses = list(ex.map(_call, tasks))
+
+    changes: list[Change] = []
+    for (entry, _), response in zip(tasks, responses, strict=True):
+        changes.extend(_apply_bullet_batch(entry, response))
+
+    return changes
+
+
+async def _arephrase_bullets(
+    ir: ResumeIR,
+    jd_json: str,
+    jd_keywords: tuple[str, ...],
+    llm: LLMProvider,
+    use_cache: bool,
+) -> list[Change]:
+    """Async twin of _rephrase_bullets.
+
+    One batched completion per experience entry, fanned out via
+    asyncio.gather (bounded by the provider's concurrency semaphore) on
+    top of the section-level gather in atailor_resume; results apply
+    back by bullet id.
+
+    Args:
+        ir: Resume IR (modified in-place).
+        jd_json: Pre-serialized JD JSON.
+        jd_keywords: Lowercased JD keywords, for the skip check.
         llm: LLM provider.
+        use_cache: Whether to consult the per-section disk cache.
 
     Returns:
         List of changes for rephrased bullets.
     """
+    tasks = _pending_bullet_batches(ir, jd_keywords)
+    if not tasks:
+        return []
+
+    responses = await asyncio.gather(
+        *(
+            _acomplete(llm, _bullets_prompt(jd_json, entry, bullets), BulletBatchResponse, use_cache)
+            for entry, bullets in tasks
+        )
+    )
+
     changes: list[Change] = []
-    jd_json = jd.model_dump_json(indent=2)
+    for (entry, _), response in zip(tasks, responses, strict=True):
+        changes.extend(_apply_bullet_batch(entry, response))
 
+    return changes
+
+
+def _pending_bullet_batches(
+    ir: ResumeIR,
+    jd_keywords: tuple[str, ...],
+) -> list[tuple[ExperienceEntry, list[BulletPoint]]]:
+    """Collect the bullets per entry that still need a rephrase.
+
+    A bullet that already contains every JD keyword has nothing to pull
+    in, so it is left out of the batch — and an entry with no pending
+    bullets skips its LLM call entirely. With no keywords to check, all
+    bullets stay in.
+
+    Args:
+        ir: Resume IR.
+        jd_keywords: Lowercased JD keywords.
+
+    Returns:
+        (entry, pending bullets) pairs for entries that need a call.
+    """
+    tasks: list[tuple[ExperienceEntry, list[BulletPoint]]] = []
     for entry in ir.experience:
-        for j, bullet in enumerate(entry.bullets):
-            user_prompt = PROMPT_BULLET_REPHRASE.format(
-                jd_json=jd_json,
-                bullet_text=bullet.text,
-                company=entry.company,
-                title=entry.title,
-            )
-
-            response = llm.complete(
-                system=SYSTEM_TAILORING,
-                user=user_prompt,
-                response_model=BulletResponse,
-            )
-
-            if response.text and response.text != bullet.text:
-                original_text = bullet.text
-                entry.bullets[j] = BulletPoint(
-                    id=bullet.id,
-                    text=response.text,
-                )
-                changes.append(
-                    Change(
-                        section="experience",
-                        original=original_text,
-                        modified=response.text,
-                        reason=response.reason or "Rephrased for JD alignment",
-                        jd_keyword=response.jd_keyword,
-                    )
-                )
+        pending = [
+            bullet
+            for bullet in entry.bullets
+            if not jd_keywords
+            or any(keyword not in bullet.text.lower() for keyword in jd_keywords)
+        ]
+        if pending:
+            tasks.append((entry, pending))
+    return tasks
+
+
+def _bullets_prompt(jd_json: str, entry: ExperienceEntry, bullets: list[BulletPoint]) -> str:
+    """Build the batched bullet-rephrase user prompt for one entry.
+
+    Args:
+        jd_json: Pre-serialized JD JSON.
+        entry: Experience entry whose bullets are being rephrased.
+        bullets: The entry's bullets that still need rephrasing.
 
+    Returns:
+        Formatted user prompt.
+    """
+    import json
+
+    bullets_json = json.dumps(
+        [{"id": b.id, "text": b.text} for b in bullets], indent=2
+    )
+    return PROMPT_BULLETS_BATCH_REPHRASE.format(
+        jd_json=jd_json,
+        bullets_json=bullets_json,
+        company=entry.company,
+        title=entry.title,
+    )
+
+
+def _apply_bullet_batch(entry: ExperienceEntry, response: BulletBatchResponse) -> list[Change]:
+    """Apply a batched bullet-rephrase response to an experience entry.
+
+    Response bullets match back to the entry's bullets by id; unknown
+    ids are ignored rather than guessed at.
+
+    Args:
+        entry: Experience entry (modified in-place).
+        response: LLM response for the entry's bullets.
+
+    Returns:
+        Change objects for the bullets that were modified.
+    """
+    index = {bullet.id: j for j, bullet in enumerate(entry.bullets)}
+    changes: list[Change] = []
+    for item in response.bullets:
+        j = index.get(item.id)
+        if j is None:
+            continue
+        change = _apply_bullet(entry, j, item)
+        if change:
+            changes.append(change)
     return changes
 
 
+def _apply_bullet(entry: ExperienceEntry, j: int, response: BulletResponse) -> Change | None:
+    """Apply a bullet-rephrase response to an experience entry.
+
+    Args:
+        entry: Experience entry (modified in-place).
+        j: Index of the bullet within the entry.
+        response: LLM response.
+
+    Returns:
+        Change object if the bullet was modified, None otherwise.
+    """
+    bullet = entry.bullets[j]
+    if response.text and response.text != bullet.text:
+        original_text = bullet.text
+        entry.bullets[j] = BulletPoint.model_construct(
+            id=bullet.id,
+            text=response.text,
+        )
+        # Fields are already-validated strings, so skip re-validation.
+        return Change.model_construct(
+            section="experience",
+            original=original_text,
+            modified=response.text,
+            reason=response.reason or "Rephrased for JD alignment",
+            jd_keyword=response.jd_keyword,
+        )
+
+    return None
+
+
 def _skills_to_json(skills: list[SkillCategory]) -> str:
     """Serialize skills to a JSON string for prompts.
 
@@ -54,23 +54,24 @@ skills and experience that exist in the resume. Preserve the user's
 writing style and voice.
 """
 
-PROMPT_BULLET_REPHRASE = """Rephrase this resume bullet point to better match the job description.
+PROMPT_BULLETS_BATCH_REPHRASE = """Rephrase these resume bullet points to better match the job description.
 
 <job_description>
 {jd_json}
 </job_description>
 
-<bullet>
-{bullet_text}
-</bullet>
+<bullets>
+{bullets_json}
+</bullets>
 
 <context>
 Company: {company}
 Role: {title}
 </context>
 
-Rephrase to incorporate relevant JD keywords where accurate.
+Rephrase each bullet to incorporate relevant JD keywords where accurate.
 Do NOT change the factual content — only adjust language and emphasis.
+Return every bullet with its original id unchanged.
 """
 
 PROMPT_SKILLS_REORDER = """Reorder the skills in each category to surface JD-relevant skills first.
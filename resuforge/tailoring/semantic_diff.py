@@ -7,15 +7,23 @@ to the LLM in a single context window and get a structured gap analysis.
 from __future__ import annotations
 
 from resuforge.llm.base import LLMProvider
+from resuforge.llm.cache import acached_complete, cached_complete
 from resuforge.resume.ir_schema import GapAnalysis, JDObject, ResumeIR
 from resuforge.tailoring.prompts import PROMPT_GAP_ANALYSIS, SYSTEM_TAILORING
 
+# Disk-cache namespace shared by all tailoring-stage completions. Keys
+# hash the full prompt (section content + JD), so when a user tweaks
+# one bullet and re-runs, every unchanged section is a cache hit and
+# only the edited section costs an LLM call.
+TAILOR_CACHE_NAMESPACE = "tailor"
+
 
 def compute_gap_analysis(
     resume: ResumeIR,
     jd: JDObject,
     *,
     llm: LLMProvider,
+    use_cache: bool = False,
 ) -> GapAnalysis:
     """Compute the semantic gap between a resume and a job description.
 
@@ -23,20 +31,70 @@ def compute_gap_analysis(
         resume: The parsed resume IR.
         jd: The parsed job description.
         llm: LLM provider for analysis.
+        use_cache: Whether to consult the tailoring disk cache.
 
     Returns:
         A GapAnalysis with strengths, gaps, and opportunities.
     """
-    resume_json = resume.model_dump_json(indent=2)
-    jd_json = jd.model_dump_json(indent=2)
+    resume_json = resume.model_dump_json()
+    jd_json = jd.model_dump_json()
 
     user_prompt = PROMPT_GAP_ANALYSIS.format(
         resume_json=resume_json,
         jd_json=jd_json,
     )
 
+    if use_cache:
+        return cached_complete(
+            llm,
+            system=SYSTEM_TAILORING,
+            user=user_prompt,
+            response_model=GapAnalysis,
+            namespace=TAILOR_CACHE_NAMESPACE,
+        )
     return llm.complete(
         system=SYSTEM_TAILORING,
         user=user_prompt,
         response_model=GapAnalysis,
     )
+
+
+async def acompute_gap_analysis(
+    resume: ResumeIR,
+    jd: JDObject,
+    *,
+    llm: LLMProvider,
+    use_cache: bool = False,
+) -> GapAnalysis:
+    """Async twin of compute_gap_analysis.
+
+    Args:
+        resume: The parsed resume IR.
+        jd: The parsed job description.
+        llm: LLM provider for analysis.
+        use_cache: Whether to consult the tailoring disk cache.
+
+    Returns:
+        A GapAnalysis with strengths, gaps, and opportunities.
+    """
+    resume_json = resume.model_dump_json()
+    jd_json = jd.model_dump_json()
+
+    user_prompt = PROMPT_GAP_ANALYSIS.format(
+        resume_json=resume_json,
+        jd_json=jd_json,
+    )
+
+    if use_cache:
+        return await acached_complete(
+            llm,
+            system=SYSTEM_TAILORING,
+            user=user_prompt,
+            response_model=GapAnalysis,
+            namespace=TAILOR_CACHE_NAMESPACE,
+        )
+    return await llm.acomplete(
+        system=SYSTEM_TAILORING,
+        user=user_prompt,
+        response_model=GapAnalysis,
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 from rich.console import Console
 from rich.table import Table
 
@@ -20,12 +22,7 @@ def display_changes(changes: list[Change]) -> None:
         console.print("[dim]No changes were made.[/dim]")
         return
 
-    table = Table(title="Tailoring Changes", show_lines=True)
-    table.add_column("Section", style="cyan", width=12)
-    table.add_column("Original", style="red")
-    table.add_column("Modified", style="green")
-    table.add_column("Reason", style="yellow", width=30)
-
+    table = _new_changes_table()
     for change in changes:
         table.add_row(
             change.section,
@@ -38,6 +35,20 @@ def display_changes(changes: list[Change]) -> None:
     console.print(f"\n[bold]{len(changes)} change(s) made.[/bold]")
 
 
+def _new_changes_table() -> Table:
+    """Build an empty changes table with the standard columns.
+
+    Returns:
+        A configured Table ready for row population.
+    """
+    table = Table(title="Tailoring Changes", show_lines=True)
+    table.add_column("Section", style="cyan", width=12)
+    table.add_column("Original", style="red")
+    table.add_column("Modified", style="green")
+    table.add_column("Reason", style="yellow", width=30)
+    return table
+
+
 def format_changes_text(changes: list[Change]) -> str:
     """Format changes as plain text (for non-terminal output).
 
@@ -50,11 +61,13 @@ def format_changes_text(changes: list[Change]) -> str:
     if not changes:
         return "No changes were made."
 
-    lines: list[str] = [f"{len(changes)} change(s):"]
+    buf = io.StringIO()
+    buf.write(f"{len(changes)} change(s):")
     for i, change in enumerate(changes, 1):
-        lines.append(f"\n{i}. [{change.section}]")
-        lines.append(f"   - {change.original}")
-        lines.append(f"   + {change.modified}")
-        lines.append(f"   Reason: {change.reason}")
-
-    return "\n".join(lines)
+        buf.write(
+            f"\n\n{i}. [{change.section}]"
+            f"\n   - {change.original}"
+            f"\n   + {change.modified}"
+            f"\n   Reason: {change.reason}"
+        )
+    return buf.getvalue()
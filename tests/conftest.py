@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import TypeVar
+from typing import Callable, NamedTuple, TypeVar
 
 import pytest
 from pydantic import BaseModel
@@ -24,7 +25,22 @@ from resuforge.resume.ir_schema import (
 
 T = TypeVar("T", bound=BaseModel)
 
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+class _Call(NamedTuple):
+    """One recorded mock LLM invocation."""
+
+    system: str
+    user: str | list[dict[str, object]]
+    response_model: type[BaseModel]
+    temperature: float
+    max_tokens: int
+
+# The suite is xdist-safe: shared fixtures below are session-scoped and
+# immutable, mock providers are built per test, and the config tests
+# isolate filesystem state through tmp_path, which pytest already keys
+# per worker. Run `pytest -n auto` to spread the CPU-bound pipeline
+# tests across cores.
+FIXTURES_DIR = (Path(__file__).parent / "fixtures").resolve()
 RESUME_FIXTURES_DIR = FIXTURES_DIR / "resumes"
 JD_FIXTURES_DIR = FIXTURES_DIR / "jds"
 EXPECTED_DIR = FIXTURES_DIR / "expected"
@@ -44,13 +60,13 @@ class MockLLMProvider(LLMProvider):
             responses: Map of model type -> response instance.
         """
         self.responses: dict[type[BaseModel], BaseModel] = responses or {}
-        self.calls: list[dict[str, object]] = []
+        self.calls: list[_Call] = []
 
     def complete(
         self,
         *,
         system: str,
-        user: str,
+        user: str | list[dict[str, object]],
         response_model: type[T],
         temperature: float = 0.3,
         max_tokens: int = 4000,
@@ -67,15 +83,7 @@ class MockLLMProvider(LLMProvider):
         Returns:
             Pre-configured response instance.
         """
-        self.calls.append(
-            {
-                "system": system,
-                "user": user,
-                "response_model": response_model,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
-        )
+        self.calls.append(_Call(system, user, response_model, temperature, max_tokens))
 
         if response_model in self.responses:
             return self.responses[response_model]  # type: ignore[return-value]
@@ -84,66 +92,78 @@ class MockLLMProvider(LLMProvider):
         return _default_response(response_model)
 
 
+# Default-response builders keyed by response-model name. The engine's
+# response models are defined next to it, so the mock dispatches on the
+# class name rather than importing them all here.
+_DEFAULT_BUILDERS: dict[str, Callable[[type[BaseModel]], BaseModel]] = {
+    "GapAnalysis": lambda model: GapAnalysis(
+        strengths=["Strong Python experience", "ML deployment knowledge"],
+        gaps=["No Kubernetes experience mentioned"],
+        opportunities=["Could reframe data pipeline work for relevance"],
+    ),
+    "SummaryResponse": lambda model: model(
+        summary="Production ML engineer with 5 years deploying scalable systems.",
+        reason="Aligned with JD focus on deployment",
+        jd_keyword="deployment",
+    ),
+    # Empty batch leaves bullets untouched, since the mock cannot know
+    # the entry's bullet ids.
+    "BulletBatchResponse": lambda model: model(bullets=[]),
+    "SkillsReorderResponse": lambda model: model(categories=[]),
+    "CoverLetterResponse": lambda model: model(
+        content=(
+            "\\documentclass{letter}\n\\begin{document}\n"
+            "Dear Hiring Manager,\n\n"
+            "I am writing to apply for the position.\n\n"
+            "Sincerely,\nJane Doe\n"
+            "\\end{document}"
+        ),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
 def _default_response(model: type[T]) -> T:
     """Generate a default response for a known model type.
 
+    Memoized per model class — the defaults are read-only in tests, so
+    there is no point re-validating the same nested models on every
+    mocked LLM call.
+
     Args:
         model: Pydantic model class.
 
     Returns:
         Default instance of the model.
     """
-    name = model.__name__ if hasattr(model, "__name__") else ""
-
-    if model is GapAnalysis or name == "GapAnalysis":
-        return GapAnalysis(  # type: ignore[return-value]
-            strengths=["Strong Python experience", "ML deployment knowledge"],
-            gaps=["No Kubernetes experience mentioned"],
-            opportunities=["Could reframe data pipeline work for relevance"],
-        )
-
-    # Summary rewrite response
-    if name == "SummaryResponse":
-        return model(  # type: ignore[call-arg]
-            summary="Production ML engineer with 5 years deploying scalable systems.",
-            reason="Aligned with JD focus on deployment",
-            jd_keyword="deployment",
-        )
+    builder = _DEFAULT_BUILDERS.get(model.__name__)
+    if builder is None:
+        raise ValueError(f"No default mock response configured for {model.__name__}")
+    return builder(model)  # type: ignore[return-value]
 
-    # Bullet rephrase response
-    if name == "BulletResponse":
-        return model(  # type: ignore[call-arg]
-            text="Led development and deployment of production recommendation system",
-            reason="Added deployment emphasis",
-            jd_keyword="deployment",
-        )
-
-    # Skills reorder response
-    if name == "SkillsReorderResponse":
-        return model(categories=[])  # type: ignore[call-arg]
-
-    # Cover letter response
-    if name == "CoverLetterResponse":
-        return model(  # type: ignore[call-arg]
-            content=(
-                "\\documentclass{letter}\n\\begin{document}\n"
-                "Dear Hiring Manager,\n\n"
-                "I am writing to apply for the position.\n\n"
-                "Sincerely,\nJane Doe\n"
-                "\\end{document}"
-            ),
-        )
 
-    raise ValueError(f"No default mock response configured for {name}")
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    """Reset the memoized load_config between tests.
 
+    load_config is lru_cached for the life of the process; tests that
+    monkeypatch env vars or CONFIG_FILE need a fresh read.
+    """
+    from resuforge.config.settings import load_config
 
-@pytest.fixture()
+    load_config.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the test fixtures directory."""
     return FIXTURES_DIR
 
 
-@pytest.fixture()
+# Session-scoped model fixtures: pydantic re-validating these nested
+# trees per test is pure setup cost, and no test mutates them — the
+# engine deep-copies its input before touching anything.
+@pytest.fixture(scope="session")
 def sample_resume_ir() -> ResumeIR:
     """Return a minimal but complete ResumeIR for testing."""
     return ResumeIR(
@@ -186,7 +206,7 @@ def sample_resume_ir() -> ResumeIR:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_jd() -> JDObject:
     """Return a sample JDObject for testing."""
     return JDObject(
@@ -205,13 +225,25 @@ def sample_jd() -> JDObject:
     )
 
 
+@pytest.fixture(scope="session")
+def runner() -> "CliRunner":
+    """Return a shared CliRunner.
+
+    CliRunner is stateless between invoke calls, so one instance serves
+    the whole session.
+    """
+    from click.testing import CliRunner
+
+    return CliRunner()
+
+
 @pytest.fixture()
 def mock_llm() -> MockLLMProvider:
     """Return a MockLLMProvider with default responses."""
     return MockLLMProvider()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_gap_analysis() -> GapAnalysis:
     """Return a sample GapAnalysis for testing."""
     return GapAnalysis(
@@ -221,7 +253,7 @@ def sample_gap_analysis() -> GapAnalysis:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_changes() -> list[Change]:
     """Return sample Change objects for testing."""
     return [
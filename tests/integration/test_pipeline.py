@@ -7,72 +7,98 @@ without real API calls. Real API integration tests are marked with
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
 from resuforge.cover_letter.generator import generate_cover_letter
 from resuforge.ingestion.jd_parser import parse_jd
-from resuforge.resume.ir_schema import ResumeIR, TailoringResult
+from resuforge.resume.ir_schema import JDObject, ResumeIR, TailoringResult
 from resuforge.resume.latex_parser import parse_latex
 from resuforge.resume.latex_renderer import render_latex
 from resuforge.tailoring.engine import tailor_resume
 from tests.conftest import MockLLMProvider
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+FIXTURES_DIR = (Path(__file__).parent.parent / "fixtures").resolve()
 RESUME_PATH = FIXTURES_DIR / "resumes" / "simple_article.tex"
 JD_PATH = FIXTURES_DIR / "jds" / "software_engineer.txt"
 ML_JD_PATH = FIXTURES_DIR / "jds" / "ml_engineer.txt"
+CUSTOM_RESUME_PATH = FIXTURES_DIR / "resumes" / "custom_commands.tex"
+
+
+# Module-scoped parses: the fixture files never change mid-run and
+# tailor_resume deep-copies its input, so each file is parsed once.
+@pytest.fixture(scope="module")
+def resume_ir_simple() -> ResumeIR:
+    """Parsed simple_article.tex, shared across the module."""
+    return parse_latex(RESUME_PATH)
+
+
+@pytest.fixture(scope="module")
+def jd_swe() -> JDObject:
+    """Parsed software-engineer JD, shared across the module."""
+    return parse_jd(JD_PATH)
+
+
+@pytest.fixture(scope="module")
+def jd_ml() -> JDObject:
+    """Parsed ML-engineer JD, shared across the module."""
+    return parse_jd(ML_JD_PATH)
 
 
 class TestMockedPipeline:
     """End-to-end pipeline tests with mocked LLM."""
 
-    def test_full_pipeline_simple(self) -> None:
-        """Full pipeline: parse -> tailor -> render with simple fixture."""
-        resume_ir = parse_latex(RESUME_PATH)
-        jd = parse_jd(JD_PATH)
+    @pytest.mark.parametrize("jd_path", [JD_PATH, ML_JD_PATH], ids=["swe", "ml"])
+    def test_full_pipeline(self, resume_ir_simple: ResumeIR, jd_path: Path) -> None:
+        """Full pipeline: parse -> tailor -> render, across JD fixtures."""
+        jd = parse_jd(jd_path)
         mock = MockLLMProvider()
 
-        result = tailor_resume(resume_ir, jd, llm=mock)
-        assert isinstance(result, TailoringResult)
-        assert isinstance(result.resume, ResumeIR)
+        result = tailor_resume(resume_ir_simple, jd, llm=mock, use_cache=False)
+        assert type(result) is TailoringResult
+        assert type(result.resume) is ResumeIR
+        assert result.gap_analysis is not None
 
         rendered = render_latex(result.resume)
         assert r"\begin{document}" in rendered
         assert result.resume.header.name == "Jane Doe"
-
-    def test_full_pipeline_ml_jd(self) -> None:
-        """Full pipeline with ML engineer JD."""
-        resume_ir = parse_latex(RESUME_PATH)
-        jd = parse_jd(ML_JD_PATH)
-        mock = MockLLMProvider()
-
-        result = tailor_resume(resume_ir, jd, llm=mock)
-        rendered = render_latex(result.resume)
-
         assert "Jane Doe" in rendered
-        assert result.gap_analysis is not None
 
-    def test_pipeline_with_cover_letter(self) -> None:
+    def test_pipeline_with_cover_letter(
+        self, resume_ir_simple: ResumeIR, jd_ml: JDObject
+    ) -> None:
         """Full pipeline including cover letter generation."""
-        resume_ir = parse_latex(RESUME_PATH)
-        jd = parse_jd(ML_JD_PATH)
         mock = MockLLMProvider()
 
-        result = tailor_resume(resume_ir, jd, llm=mock)
-        cover_letter = generate_cover_letter(result.resume, jd, llm=mock)
+        result = tailor_resume(resume_ir_simple, jd_ml, llm=mock, use_cache=False)
+        cover_letter = generate_cover_letter(result.resume, jd_ml, llm=mock, use_cache=False)
 
         assert isinstance(cover_letter, str)
         assert len(cover_letter) > 0
 
-    def test_round_trip_after_tailoring(self) -> None:
+    def test_rendered_contains_key_fields(
+        self, resume_ir_simple: ResumeIR, jd_swe: JDObject
+    ) -> None:
+        """Rendered output carries the tailored resume's key fields."""
+        mock = MockLLMProvider()
+
+        result = tailor_resume(resume_ir_simple, jd_swe, llm=mock, use_cache=False)
+        rendered = render_latex(result.resume)
+
+        assert result.resume.header.name in rendered
+        for entry in result.resume.experience:
+            assert entry.company in rendered
+
+    @pytest.mark.slow
+    def test_round_trip_after_tailoring(
+        self, resume_ir_simple: ResumeIR, jd_swe: JDObject
+    ) -> None:
         """Tailored resume can be rendered and re-parsed."""
-        resume_ir = parse_latex(RESUME_PATH)
-        jd = parse_jd(JD_PATH)
         mock = MockLLMProvider()
 
-        result = tailor_resume(resume_ir, jd, llm=mock)
+        result = tailor_resume(resume_ir_simple, jd_swe, llm=mock, use_cache=False)
         rendered = render_latex(result.resume)
         reparsed = parse_latex(rendered)
 
@@ -81,12 +107,11 @@ class TestMockedPipeline:
 
     def test_custom_commands_fixture(self) -> None:
         """Pipeline works with custom commands fixture."""
-        custom_path = FIXTURES_DIR / "resumes" / "custom_commands.tex"
-        resume_ir = parse_latex(custom_path)
+        resume_ir = parse_latex(CUSTOM_RESUME_PATH)
         jd = parse_jd(JD_PATH)
         mock = MockLLMProvider()
 
-        result = tailor_resume(resume_ir, jd, llm=mock)
+        result = tailor_resume(resume_ir, jd, llm=mock, use_cache=False)
         rendered = render_latex(result.resume)
 
         assert "Alex Chen" in rendered
@@ -94,28 +119,29 @@ class TestMockedPipeline:
 
 
 @pytest.mark.integration
+@pytest.mark.skipif(
+    not os.environ.get("ANTHROPIC_API_KEY"), reason="ANTHROPIC_API_KEY not set"
+)
 class TestRealLLMPipeline:
     """Integration tests that require a real API key.
 
     Run with: pytest -m integration (requires ANTHROPIC_API_KEY)
+
+    The key check happens at collection, so without a key the tests skip
+    before the anthropic client is ever imported.
     """
 
     def test_real_tailoring(self) -> None:
         """Full tailoring with real LLM calls."""
-        import os
-
         from resuforge.llm.anthropic_client import AnthropicClient
 
-        if not os.environ.get("ANTHROPIC_API_KEY"):
-            pytest.skip("ANTHROPIC_API_KEY not set")
-
         resume_ir = parse_latex(RESUME_PATH)
         jd = parse_jd(ML_JD_PATH)
         llm = AnthropicClient()
 
         result = tailor_resume(resume_ir, jd, llm=llm)
 
-        assert isinstance(result, TailoringResult)
+        assert type(result) is TailoringResult
         assert result.gap_analysis is not None
         assert result.resume.header.name == "Jane Doe"
         # Verify immutable fields
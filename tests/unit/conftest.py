@@ -0,0 +1,47 @@
+"""Shared fixtures for the unit test suite.
+
+The parser tests are read-only assertions over the same fixture files,
+so each file is parsed once per session and the resulting models are
+shared. Do not mutate these — take a model_copy first if a test ever
+needs to.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from resuforge.ingestion.jd_parser import parse_jd
+from resuforge.resume.ir_schema import JDObject, ResumeIR
+from resuforge.resume.latex_parser import parse_latex
+from resuforge.resume.latex_renderer import render_latex
+from tests.conftest import JD_FIXTURES_DIR, RESUME_FIXTURES_DIR
+
+
+@pytest.fixture(scope="session")
+def simple_article_ir() -> ResumeIR:
+    """Parsed simple_article.tex, shared across the session."""
+    return parse_latex(RESUME_FIXTURES_DIR / "simple_article.tex")
+
+
+@pytest.fixture(scope="session")
+def custom_commands_ir() -> ResumeIR:
+    """Parsed custom_commands.tex, shared across the session."""
+    return parse_latex(RESUME_FIXTURES_DIR / "custom_commands.tex")
+
+
+@pytest.fixture(scope="session")
+def rendered_sample(sample_resume_ir: ResumeIR) -> str:
+    """sample_resume_ir rendered to LaTeX, shared across the session."""
+    return render_latex(sample_resume_ir)
+
+
+@pytest.fixture(scope="session")
+def software_engineer_jd() -> JDObject:
+    """Parsed software_engineer.txt JD, shared across the session."""
+    return parse_jd(JD_FIXTURES_DIR / "software_engineer.txt")
+
+
+@pytest.fixture(scope="session")
+def ml_engineer_jd() -> JDObject:
+    """Parsed ml_engineer.txt JD, shared across the session."""
+    return parse_jd(JD_FIXTURES_DIR / "ml_engineer.txt")
@@ -5,16 +5,22 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
 from resuforge.cli.main import app
 from resuforge.resume.ir_schema import Change
 from resuforge.utils.diff import display_changes, format_changes_text
 
-FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+FIXTURES_DIR = (Path(__file__).parent.parent / "fixtures").resolve()
 RESUME_PATH = str(FIXTURES_DIR / "resumes" / "simple_article.tex")
 JD_PATH = str(FIXTURES_DIR / "jds" / "software_engineer.txt")
 
+# Resolved once — the group callback is empty, so invoking subcommands
+# directly skips re-walking the command tree on every invoke.
+TAILOR_CMD = app.commands["tailor"]
+CONFIG_CMD = app.commands["config"]
+
 
 # ---------------------------------------------------------------------------
 # CLI basic tests
@@ -24,39 +30,34 @@ JD_PATH = str(FIXTURES_DIR / "jds" / "software_engineer.txt")
 class TestCLIBasic:
     """Tests for basic CLI functionality."""
 
-    def test_version_flag(self) -> None:
+    def test_version_flag(self, runner: CliRunner) -> None:
         """--version prints version and exits."""
-        runner = CliRunner()
         result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_help_flag(self) -> None:
+    def test_help_flag(self, runner: CliRunner) -> None:
         """--help prints usage and exits."""
-        runner = CliRunner()
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert "ResuForge" in result.output
 
-    def test_tailor_help(self) -> None:
+    def test_tailor_help(self, runner: CliRunner) -> None:
         """tailor --help shows command options."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["tailor", "--help"])
+        result = runner.invoke(TAILOR_CMD, ["--help"])
         assert result.exit_code == 0
         assert "--resume" in result.output
         assert "--jd" in result.output
         assert "--dry-run" in result.output
 
-    def test_tailor_missing_resume(self) -> None:
+    def test_tailor_missing_resume(self, runner: CliRunner) -> None:
         """tailor without --resume exits with error."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["tailor", "--jd", JD_PATH])
+        result = runner.invoke(TAILOR_CMD, ["--jd", JD_PATH])
         assert result.exit_code != 0
 
-    def test_tailor_missing_jd(self) -> None:
+    def test_tailor_missing_jd(self, runner: CliRunner) -> None:
         """tailor without --jd exits with error."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["tailor", "--resume", RESUME_PATH])
+        result = runner.invoke(TAILOR_CMD, ["--resume", RESUME_PATH])
         assert result.exit_code != 0
 
 
@@ -69,13 +70,11 @@ class TestTailorCommand:
     """Tests for the tailor command with mocked pipeline."""
 
     @patch("resuforge.cli.main._run_tailor_pipeline")
-    def test_tailor_calls_pipeline(self, mock_pipeline: object) -> None:
+    def test_tailor_calls_pipeline(self, mock_pipeline: object, runner: CliRunner) -> None:
         """tailor command invokes the pipeline."""
-        runner = CliRunner()
         runner.invoke(
-            app,
+            TAILOR_CMD,
             [
-                "tailor",
                 "--resume",
                 RESUME_PATH,
                 "--jd",
@@ -95,17 +94,15 @@ class TestTailorCommand:
 class TestConfigCommand:
     """Tests for the config command."""
 
-    def test_config_shows_defaults(self) -> None:
+    def test_config_shows_defaults(self, runner: CliRunner) -> None:
         """config with no flags shows current config."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["config"])
+        result = runner.invoke(CONFIG_CMD, [])
         assert result.exit_code == 0
         assert "Provider" in result.output or "provider" in result.output.lower()
 
-    def test_config_set_key_warning(self) -> None:
+    def test_config_set_key_warning(self, runner: CliRunner) -> None:
         """config --set-key warns about env vars."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["config", "--set-key", "test-key"])
+        result = runner.invoke(CONFIG_CMD, ["--set-key", "test-key"])
         assert result.exit_code == 0
         assert "environment" in result.output.lower()
 
@@ -118,15 +115,12 @@ class TestConfigCommand:
 class TestDiffDisplay:
     """Tests for the diff display utility."""
 
-    def test_display_empty_changes(self) -> None:
-        """display_changes handles empty list."""
-        # Should not raise
-        display_changes([])
-
-    def test_display_with_changes(self, sample_changes: list[Change]) -> None:
-        """display_changes handles a list of changes."""
+    @pytest.mark.parametrize("changes_fx", ["empty", "sample_changes"])
+    def test_display_does_not_raise(self, request: pytest.FixtureRequest, changes_fx: str) -> None:
+        """display_changes handles empty and populated change lists."""
+        changes = [] if changes_fx == "empty" else request.getfixturevalue(changes_fx)
         # Should not raise
-        display_changes(sample_changes)
+        display_changes(changes)
 
     def test_format_text_empty(self) -> None:
         """format_changes_text handles empty list."""
@@ -14,6 +14,24 @@ from resuforge.config.settings import (
     save_config,
 )
 
+
+@pytest.fixture(scope="session")
+def default_cfg() -> ResuForgeConfig:
+    """A default config instance shared across tests; never mutated."""
+    return ResuForgeConfig()
+
+
+@pytest.fixture()
+def patched_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    """Point CONFIG_DIR/CONFIG_FILE at a tmp_path and return both."""
+    import resuforge.config.settings as settings_mod
+
+    config_dir = tmp_path / ".resuforge"
+    config_file = config_dir / "config.yaml"
+    monkeypatch.setattr(settings_mod, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(settings_mod, "CONFIG_FILE", config_file)
+    return config_dir, config_file
+
 # ---------------------------------------------------------------------------
 # Config model
 # ---------------------------------------------------------------------------
@@ -63,19 +81,14 @@ class TestLoadConfig:
         cfg = load_config()
         assert cfg.default_model == "gpt-4o"
 
-    def test_loads_from_yaml(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_loads_from_yaml(self, patched_config: tuple[Path, Path]) -> None:
         """Loads config from YAML file if it exists."""
-        import resuforge.config.settings as settings_mod
-
-        config_dir = tmp_path / ".resuforge"
+        config_dir, config_file = patched_config
         config_dir.mkdir()
-        config_file = config_dir / "config.yaml"
         config_file.write_text(
             "default_model: custom-model\nprovider: openai\ncover_letter_tone: casual\n",
             encoding="utf-8",
         )
-        monkeypatch.setattr(settings_mod, "CONFIG_DIR", config_dir)
-        monkeypatch.setattr(settings_mod, "CONFIG_FILE", config_file)
 
         cfg = load_config()
         assert cfg.default_model == "custom-model"
@@ -91,49 +104,35 @@ class TestLoadConfig:
 class TestSaveConfig:
     """Tests for config saving."""
 
-    def test_save_creates_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_save_creates_file(self, patched_config: tuple[Path, Path]) -> None:
         """save_config creates the config file."""
-        import resuforge.config.settings as settings_mod
-
-        config_dir = tmp_path / ".resuforge"
-        config_file = config_dir / "config.yaml"
-        monkeypatch.setattr(settings_mod, "CONFIG_DIR", config_dir)
-        monkeypatch.setattr(settings_mod, "CONFIG_FILE", config_file)
+        _, config_file = patched_config
 
         cfg = ResuForgeConfig(default_model="test-model")
         save_config(cfg)
         assert config_file.exists()
 
-    def test_save_excludes_api_keys(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Saved config does not contain API keys."""
-        import resuforge.config.settings as settings_mod
-
-        config_dir = tmp_path / ".resuforge"
-        config_file = config_dir / "config.yaml"
-        monkeypatch.setattr(settings_mod, "CONFIG_DIR", config_dir)
-        monkeypatch.setattr(settings_mod, "CONFIG_FILE", config_file)
+    def test_save_roundtrip_excludes_api_keys(
+        self, patched_config: tuple[Path, Path], default_cfg: ResuForgeConfig
+    ) -> None:
+        """Config round-trips through YAML without leaking API keys."""
+        _, config_file = patched_config
 
         fake = "FAKE_FOR_TEST"
-        cfg = ResuForgeConfig(**{"anthropic_api_key": fake})
-        save_config(cfg)
+        # model_copy skips re-validating the untouched fields.
+        original = default_cfg.model_copy(
+            update={
+                "default_model": "test-model",
+                "provider": "openai",
+                "cover_letter_tone": "casual",
+                "anthropic_api_key": fake,
+            }
+        )
+        save_config(original)
+
         content = config_file.read_text(encoding="utf-8")
         assert fake not in content
 
-    def test_save_roundtrip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Config can be saved and loaded back."""
-        import resuforge.config.settings as settings_mod
-
-        config_dir = tmp_path / ".resuforge"
-        config_file = config_dir / "config.yaml"
-        monkeypatch.setattr(settings_mod, "CONFIG_DIR", config_dir)
-        monkeypatch.setattr(settings_mod, "CONFIG_FILE", config_file)
-
-        original = ResuForgeConfig(
-            default_model="test-model",
-            provider="openai",
-            cover_letter_tone="casual",
-        )
-        save_config(original)
         loaded = load_config()
         assert loaded.default_model == "test-model"
         assert loaded.provider == "openai"
@@ -10,6 +10,7 @@ from resuforge.resume.ir_schema import ResumeIR
 from resuforge.resume.latex_parser import parse_latex
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "resumes"
+SIMPLE_TEX = FIXTURES_DIR / "simple_article.tex"
 
 
 # ---------------------------------------------------------------------------
@@ -20,26 +21,29 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "resumes"
 class TestParseLatexBasic:
     """Tests for basic parsing functionality."""
 
-    def test_parse_from_file_path(self) -> None:
-        """Parser accepts a Path and returns ResumeIR."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
-        assert isinstance(ir, ResumeIR)
+    def test_parse_from_file_path(self, simple_article_ir: ResumeIR) -> None:
+        """Parser accepts a Path and produces a populated IR."""
+        assert simple_article_ir.header is not None
 
     def test_parse_from_string(self) -> None:
         """Parser accepts a LaTeX string directly."""
-        tex = (FIXTURES_DIR / "simple_article.tex").read_text(encoding="utf-8")
+        tex = SIMPLE_TEX.read_text(encoding="utf-8")
         ir = parse_latex(tex)
-        assert isinstance(ir, ResumeIR)
-
-    def test_parse_nonexistent_file_raises(self) -> None:
-        """Parser raises FileNotFoundError for missing files."""
-        with pytest.raises(FileNotFoundError):
-            parse_latex(Path("/nonexistent/resume.tex"))
-
-    def test_parse_empty_string_raises(self) -> None:
-        """Parser raises ValueError for empty input."""
-        with pytest.raises(ValueError, match="empty"):
-            parse_latex("")
+        assert ir.header is not None
+
+    @pytest.mark.parametrize(
+        ("bad", "exc", "match"),
+        [
+            pytest.param(Path("/nonexistent/resume.tex"), FileNotFoundError, None, id="missing-file"),
+            pytest.param("", ValueError, "empty", id="empty-input"),
+        ],
+    )
+    def test_bad_input_raises(
+        self, bad: Path | str, exc: type[Exception], match: str | None
+    ) -> None:
+        """Parser raises the right exception for bad input."""
+        with pytest.raises(exc, match=match):
+            parse_latex(bad)
 
 
 # ---------------------------------------------------------------------------
@@ -50,22 +54,22 @@ class TestParseLatexBasic:
 class TestPreambleExtraction:
     """Tests for preamble and custom command extraction."""
 
-    def test_preamble_extracted(self) -> None:
+    def test_preamble_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Preamble is everything before \\begin{document}."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert r"\documentclass" in ir.preamble
         assert r"\usepackage" in ir.preamble
         assert r"\begin{document}" not in ir.preamble
 
-    def test_custom_commands_detected(self) -> None:
+    def test_custom_commands_detected(self, custom_commands_ir: ResumeIR) -> None:
         """Custom \\newcommand definitions are captured."""
-        ir = parse_latex(FIXTURES_DIR / "custom_commands.tex")
+        ir = custom_commands_ir
         assert len(ir.custom_commands) >= 2
-        assert any("resumeHeading" in cmd for cmd in ir.custom_commands)
+        assert "resumeHeading" in "\n".join(ir.custom_commands)
 
-    def test_simple_has_no_custom_commands(self) -> None:
+    def test_simple_has_no_custom_commands(self, simple_article_ir: ResumeIR) -> None:
         """Simple article template has no custom commands."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.custom_commands) == 0
 
 
@@ -77,37 +81,37 @@ class TestPreambleExtraction:
 class TestHeaderParsing:
     """Tests for header section extraction."""
 
-    def test_name_extracted(self) -> None:
+    def test_name_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts the resume holder's name."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.header.name == "Jane Doe"
 
-    def test_email_extracted(self) -> None:
+    def test_email_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts email address."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.header.email == "jane@example.com"
 
-    def test_phone_extracted(self) -> None:
+    def test_phone_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts phone number."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.header.phone == "+1-555-0100"
 
-    def test_location_extracted(self) -> None:
+    def test_location_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts location."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.header.location == "San Francisco, CA"
 
-    def test_links_extracted(self) -> None:
+    def test_links_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts hyperlinked URLs."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.header.links) == 2
-        labels = {link.label for link in ir.header.links}
+        labels = [link.label for link in ir.header.links]
         assert "GitHub" in labels
         assert "LinkedIn" in labels
 
-    def test_custom_header_parsed(self) -> None:
+    def test_custom_header_parsed(self, custom_commands_ir: ResumeIR) -> None:
         """Parser handles different header formats."""
-        ir = parse_latex(FIXTURES_DIR / "custom_commands.tex")
+        ir = custom_commands_ir
         assert ir.header.name == "Alex Chen"
         assert ir.header.email == "alex.chen@email.com"
 
@@ -120,40 +124,40 @@ class TestHeaderParsing:
 class TestExperienceParsing:
     """Tests for experience section extraction."""
 
-    def test_experience_entries_found(self) -> None:
+    def test_experience_entries_found(self, simple_article_ir: ResumeIR) -> None:
         """Parser finds all experience entries."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.experience) == 2
 
-    def test_experience_company_and_title(self) -> None:
+    def test_experience_company_and_title(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts company and title correctly."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.experience[0]
         assert first.title == "Senior ML Engineer"
         assert first.company == "Acme Corp"
 
-    def test_experience_dates(self) -> None:
+    def test_experience_dates(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts date ranges."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
-        assert "2022" in ir.experience[0].dates
-        assert "Present" in ir.experience[0].dates
+        dates = simple_article_ir.experience[0].dates
+        assert "2022" in dates
+        assert "Present" in dates
 
-    def test_experience_bullets(self) -> None:
+    def test_experience_bullets(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts bullet points with stable IDs."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.experience[0]
         assert len(first.bullets) == 3
         assert first.bullets[0].id == "exp_0_0"
         assert "recommendation" in first.bullets[0].text.lower()
 
-    def test_experience_location(self) -> None:
+    def test_experience_location(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts location from experience entries."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.experience[0].location == "San Francisco, CA"
 
-    def test_custom_command_experience(self) -> None:
+    def test_custom_command_experience(self, custom_commands_ir: ResumeIR) -> None:
         """Parser handles \\resumeHeading style entries."""
-        ir = parse_latex(FIXTURES_DIR / "custom_commands.tex")
+        ir = custom_commands_ir
         assert len(ir.experience) == 2
         assert ir.experience[0].title == "Staff Software Engineer"
         assert ir.experience[0].company == "MegaTech Ltd"
@@ -167,23 +171,23 @@ class TestExperienceParsing:
 class TestEducationParsing:
     """Tests for education section extraction."""
 
-    def test_education_entries_found(self) -> None:
+    def test_education_entries_found(self, simple_article_ir: ResumeIR) -> None:
         """Parser finds all education entries."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.education) == 2
 
-    def test_education_degree_and_school(self) -> None:
+    def test_education_degree_and_school(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts degree and school."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.education[0]
         assert "M.S." in first.degree
         assert "Stanford" in first.school
 
-    def test_education_details(self) -> None:
+    def test_education_details(self, simple_article_ir: ResumeIR) -> None:
         """Parser captures extra detail lines."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.education[0]
-        assert any("GPA" in d for d in first.details)
+        assert "GPA" in "\n".join(first.details)
 
 
 # ---------------------------------------------------------------------------
@@ -194,20 +198,20 @@ class TestEducationParsing:
 class TestSkillsParsing:
     """Tests for skills section extraction."""
 
-    def test_skill_categories_found(self) -> None:
+    def test_skill_categories_found(self, simple_article_ir: ResumeIR) -> None:
         """Parser finds all skill categories."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.skills) >= 3
 
-    def test_skill_category_name(self) -> None:
+    def test_skill_category_name(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts category name."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         categories = {s.category for s in ir.skills}
         assert "Languages" in categories
 
-    def test_skill_items(self) -> None:
+    def test_skill_items(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts individual skills within categories."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         lang = next(s for s in ir.skills if s.category == "Languages")
         assert "Python" in lang.items
         assert "C++" in lang.items
@@ -221,26 +225,26 @@ class TestSkillsParsing:
 class TestProjectsParsing:
     """Tests for projects section extraction."""
 
-    def test_project_entries_found(self) -> None:
+    def test_project_entries_found(self, simple_article_ir: ResumeIR) -> None:
         """Parser finds all project entries."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.projects) == 2
 
-    def test_project_name(self) -> None:
+    def test_project_name(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts project names."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.projects[0].name == "ResuForge"
 
-    def test_project_bullets(self) -> None:
+    def test_project_bullets(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts project bullet points."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.projects[0]
         assert len(first.bullets) == 2
         assert first.bullets[0].id == "proj_0_0"
 
-    def test_project_url(self) -> None:
+    def test_project_url(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts project URLs."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         first = ir.projects[0]
         assert first.url is not None
         assert "github" in first.url.lower()
@@ -254,25 +258,25 @@ class TestProjectsParsing:
 class TestSectionOrdering:
     """Tests for section_order and raw_sections handling."""
 
-    def test_section_order_captured(self) -> None:
+    def test_section_order_captured(self, simple_article_ir: ResumeIR) -> None:
         """Parser records the order of sections as they appear."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert len(ir.section_order) > 0
         assert "experience" in ir.section_order
 
-    def test_summary_in_section_order(self) -> None:
+    def test_summary_in_section_order(self, simple_article_ir: ResumeIR) -> None:
         """Summary section appears in ordering."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert "summary" in ir.section_order
 
-    def test_unknown_sections_go_to_raw(self) -> None:
+    def test_unknown_sections_go_to_raw(self, custom_commands_ir: ResumeIR) -> None:
         """Sections not recognized are stored in raw_sections."""
-        ir = parse_latex(FIXTURES_DIR / "custom_commands.tex")
+        ir = custom_commands_ir
         # "Certifications" is not a standard recognized section
         assert "certifications" in ir.raw_sections
 
-    def test_summary_extracted(self) -> None:
+    def test_summary_extracted(self, simple_article_ir: ResumeIR) -> None:
         """Parser extracts the summary text."""
-        ir = parse_latex(FIXTURES_DIR / "simple_article.tex")
+        ir = simple_article_ir
         assert ir.summary is not None
         assert "ML engineer" in ir.summary
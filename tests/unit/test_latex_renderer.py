@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
+import pytest
+
 from resuforge.resume.ir_schema import (
     BulletPoint,
     ExperienceEntry,
@@ -26,21 +29,18 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "resumes"
 class TestRenderBasic:
     """Tests for basic rendering functionality."""
 
-    def test_render_returns_string(self, sample_resume_ir: ResumeIR) -> None:
+    def test_render_returns_string(self, rendered_sample: str) -> None:
         """Renderer returns a string."""
-        result = render_latex(sample_resume_ir)
-        assert isinstance(result, str)
+        assert isinstance(rendered_sample, str)
 
-    def test_render_contains_documentclass(self, sample_resume_ir: ResumeIR) -> None:
+    def test_render_contains_documentclass(self, rendered_sample: str) -> None:
         """Output contains documentclass from preamble."""
-        result = render_latex(sample_resume_ir)
-        assert r"\documentclass" in result
+        assert r"\documentclass" in rendered_sample
 
-    def test_render_contains_begin_end_document(self, sample_resume_ir: ResumeIR) -> None:
+    def test_render_contains_begin_end_document(self, rendered_sample: str) -> None:
         """Output has begin/end document tags."""
-        result = render_latex(sample_resume_ir)
-        assert r"\begin{document}" in result
-        assert r"\end{document}" in result
+        assert r"\begin{document}" in rendered_sample
+        assert r"\end{document}" in rendered_sample
 
     def test_render_empty_ir(self) -> None:
         """Renderer handles minimal IR gracefully."""
@@ -58,20 +58,17 @@ class TestRenderBasic:
 class TestRenderHeader:
     """Tests for header rendering."""
 
-    def test_name_rendered(self, sample_resume_ir: ResumeIR) -> None:
+    def test_name_rendered(self, rendered_sample: str) -> None:
         """Name appears in output."""
-        result = render_latex(sample_resume_ir)
-        assert "Jane Doe" in result
+        assert "Jane Doe" in rendered_sample
 
-    def test_email_rendered(self, sample_resume_ir: ResumeIR) -> None:
+    def test_email_rendered(self, rendered_sample: str) -> None:
         """Email appears in output."""
-        result = render_latex(sample_resume_ir)
-        assert "jane@example.com" in result
+        assert "jane@example.com" in rendered_sample
 
-    def test_links_rendered(self, sample_resume_ir: ResumeIR) -> None:
+    def test_links_rendered(self, rendered_sample: str) -> None:
         """Links are rendered as \\href commands."""
-        result = render_latex(sample_resume_ir)
-        assert r"\href{https://github.com/janedoe}{GitHub}" in result
+        assert r"\href{https://github.com/janedoe}{GitHub}" in rendered_sample
 
 
 # ---------------------------------------------------------------------------
@@ -82,36 +79,25 @@ class TestRenderHeader:
 class TestRenderSections:
     """Tests for individual section rendering."""
 
-    def test_summary_rendered(self, sample_resume_ir: ResumeIR) -> None:
-        """Summary section appears in output."""
-        result = render_latex(sample_resume_ir)
-        assert r"\section*{Summary}" in result
-        assert "ML engineer" in result
-
-    def test_experience_rendered(self, sample_resume_ir: ResumeIR) -> None:
-        """Experience entries appear in output."""
-        result = render_latex(sample_resume_ir)
-        assert "Senior ML Engineer" in result
-        assert "Acme Corp" in result
-
-    def test_experience_bullets_rendered(self, sample_resume_ir: ResumeIR) -> None:
-        """Experience bullet points are rendered as \\item."""
-        result = render_latex(sample_resume_ir)
-        assert r"\item" in result
-        assert "recommendation system" in result
-
-    def test_skills_rendered(self, sample_resume_ir: ResumeIR) -> None:
-        """Skills section renders categories and items."""
-        result = render_latex(sample_resume_ir)
-        assert r"\section*{Skills}" in result
-        assert "Python" in result
-        assert "Languages" in result
-
-    def test_education_rendered(self, sample_resume_ir: ResumeIR) -> None:
-        """Education entries appear in output."""
-        result = render_latex(sample_resume_ir)
-        assert "Stanford University" in result
-        assert "M.S. Computer Science" in result
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            r"\section*{Summary}",
+            "ML engineer",
+            "Senior ML Engineer",
+            "Acme Corp",
+            r"\item",
+            "recommendation system",
+            r"\section*{Skills}",
+            "Python",
+            "Languages",
+            "Stanford University",
+            "M.S. Computer Science",
+        ],
+    )
+    def test_section_content_rendered(self, rendered_sample: str, needle: str) -> None:
+        """Each section's key content appears in the rendered output."""
+        assert needle in rendered_sample
 
     def test_section_order_respected(self) -> None:
         """Sections render in the order specified by section_order."""
@@ -130,10 +116,11 @@ class TestRenderSections:
             section_order=["skills", "summary", "experience"],
         )
         result = render_latex(ir)
-        skills_pos = result.index("Skills")
-        summary_pos = result.index("Summary")
-        exp_pos = result.index("Experience")
-        assert skills_pos < summary_pos < exp_pos
+        # One scan over the output instead of an index() call per section.
+        positions: dict[str, int] = {}
+        for match in re.finditer(r"Skills|Summary|Experience", result):
+            positions.setdefault(match.group(), match.start())
+        assert positions["Skills"] < positions["Summary"] < positions["Experience"]
 
 
 # ---------------------------------------------------------------------------
@@ -181,63 +168,53 @@ class TestRenderRawAndProjects:
 class TestRoundTrip:
     """Round-trip tests: parse -> render -> parse -> assert structural equivalence."""
 
-    def test_round_trip_simple_article(self) -> None:
+    def test_round_trip_simple_article(self, simple_article_ir: ResumeIR) -> None:
         """Parse simple_article.tex, render, parse again, compare."""
-        ir1 = parse_latex(FIXTURES_DIR / "simple_article.tex")
-        rendered = render_latex(ir1)
+        rendered = render_latex(simple_article_ir)
         ir2 = parse_latex(rendered)
-        _assert_ir_equivalent(ir1, ir2)
+        _assert_ir_equivalent(simple_article_ir, ir2)
 
-    def test_round_trip_custom_commands(self) -> None:
+    def test_round_trip_custom_commands(self, custom_commands_ir: ResumeIR) -> None:
         """Parse custom_commands.tex, render, parse again, compare."""
-        ir1 = parse_latex(FIXTURES_DIR / "custom_commands.tex")
-        rendered = render_latex(ir1)
+        rendered = render_latex(custom_commands_ir)
         ir2 = parse_latex(rendered)
-        _assert_ir_equivalent(ir1, ir2)
+        _assert_ir_equivalent(custom_commands_ir, ir2)
 
 
 def _assert_ir_equivalent(ir1: ResumeIR, ir2: ResumeIR) -> None:
     """Assert two ResumeIRs are structurally equivalent.
 
-    Compares header, experience, education, skills, projects, summary,
-    and section_order. Raw sections and preamble may differ in formatting.
+    Compares header, experience, education, skills, projects, and
+    summary via one normalized-projection compare — pytest diffs the
+    tuples on failure. Raw sections and preamble may differ in
+    formatting.
 
     Args:
         ir1: First IR (from original parse).
         ir2: Second IR (from round-trip parse).
     """
-    # Header
-    assert ir1.header.name == ir2.header.name
-    assert ir1.header.email == ir2.header.email
-
-    # Summary
     if ir1.summary:
         assert ir2.summary is not None
-        assert ir1.summary.strip() == ir2.summary.strip()
-
-    # Experience
-    assert len(ir1.experience) == len(ir2.experience)
-    for e1, e2 in zip(ir1.experience, ir2.experience, strict=True):
-        assert e1.title == e2.title
-        assert e1.company == e2.company
-        assert len(e1.bullets) == len(e2.bullets)
-        for b1, b2 in zip(e1.bullets, e2.bullets, strict=True):
-            assert b1.text == b2.text
-
-    # Education
-    assert len(ir1.education) == len(ir2.education)
-    for ed1, ed2 in zip(ir1.education, ir2.education, strict=True):
-        assert ed1.school == ed2.school
-        assert ed1.degree == ed2.degree
-
-    # Skills
-    assert len(ir1.skills) == len(ir2.skills)
-    for s1, s2 in zip(ir1.skills, ir2.skills, strict=True):
-        assert s1.category == s2.category
-        assert s1.items == s2.items
-
-    # Projects
-    assert len(ir1.projects) == len(ir2.projects)
-    for p1, p2 in zip(ir1.projects, ir2.projects, strict=True):
-        assert p1.name == p2.name
-        assert len(p1.bullets) == len(p2.bullets)
+    assert _project(ir1) == _project(ir2)
+
+
+def _project(ir: ResumeIR) -> tuple[object, ...]:
+    """Project the round-trip-stable fields of an IR into a tuple.
+
+    Args:
+        ir: Parsed resume IR.
+
+    Returns:
+        Nested tuple of the fields compared for round-trip equivalence.
+    """
+    return (
+        ir.header.name,
+        ir.header.email,
+        ir.summary.strip() if ir.summary else None,
+        tuple(
+            (e.title, e.company, tuple(b.text for b in e.bullets)) for e in ir.experience
+        ),
+        tuple((ed.school, ed.degree) for ed in ir.education),
+        tuple((s.category, tuple(s.items)) for s in ir.skills),
+        tuple((p.name, len(p.bullets)) for p in ir.projects),
+    )
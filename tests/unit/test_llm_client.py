@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import BaseModel
 
+from resuforge.llm.anthropic_client import AnthropicClient
 from resuforge.llm.base import LLMProvider
 from resuforge.llm.exceptions import LLMError
 from resuforge.resume.ir_schema import GapAnalysis
@@ -33,7 +34,7 @@ class TestMockLLMProvider:
             user="test",
             response_model=GapAnalysis,
         )
-        assert isinstance(result, GapAnalysis)
+        assert type(result) is GapAnalysis
         assert len(result.strengths) > 0
 
     def test_mock_records_calls(self) -> None:
@@ -41,8 +42,8 @@ class TestMockLLMProvider:
         mock = MockLLMProvider()
         mock.complete(system="sys", user="usr", response_model=GapAnalysis)
         assert len(mock.calls) == 1
-        assert mock.calls[0]["system"] == "sys"
-        assert mock.calls[0]["user"] == "usr"
+        assert mock.calls[0].system == "sys"
+        assert mock.calls[0].user == "usr"
 
     def test_mock_custom_responses(self) -> None:
         """Mock uses custom response overrides."""
@@ -103,24 +104,18 @@ class TestAnthropicClient:
 
     def test_init_with_explicit_key(self) -> None:
         """Client initializes with explicit key."""
-        from resuforge.llm.anthropic_client import AnthropicClient
-
         client = AnthropicClient(FAKE_KEY)
         assert isinstance(client, LLMProvider)
 
     def test_init_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Client reads key from environment."""
         monkeypatch.setenv("ANTHROPIC_API_KEY", FAKE_KEY)
-        from resuforge.llm.anthropic_client import AnthropicClient
-
         client = AnthropicClient()
         assert isinstance(client, LLMProvider)
 
     def test_init_no_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Client raises LLMError without key."""
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-        from resuforge.llm.anthropic_client import AnthropicClient
-
         with pytest.raises(LLMError, match="API key"):
             AnthropicClient()
 
@@ -130,8 +125,6 @@ class TestAnthropicClient:
         self, mock_anthropic: MagicMock, mock_instructor: MagicMock
     ) -> None:
         """Complete method calls instructor for structured output."""
-        from resuforge.llm.anthropic_client import AnthropicClient
-
         mock_client = MagicMock()
         mock_anthropic.Anthropic.return_value = mock_client
         mock_instructor_client = MagicMock()
@@ -149,6 +142,6 @@ class TestAnthropicClient:
             response_model=GapAnalysis,
         )
 
-        assert isinstance(result, GapAnalysis)
+        assert type(result) is GapAnalysis
         assert result.strengths == ["test"]
         mock_instructor_client.messages.create.assert_called_once()